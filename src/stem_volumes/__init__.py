@@ -6,15 +6,13 @@ import os
 import pstats
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor
-from functools import lru_cache
 from inspect import signature
 
 import numpy as np
 import pandas as pd
-from line_profiler import LineProfiler
 
-import stem_volumes.formulas
+from stem_volumes.batch import FORMULA_SPECS, TreeBatch
+from stem_volumes.formulas import FORMULAS
 from stem_volumes.species_to_formula_map import species_to_formulas
 from stem_volumes.utils import (
     clean_data,
@@ -24,11 +22,11 @@ from stem_volumes.utils import (
 )
 
 
-def __orig_main():
-    pr = cProfile.Profile()
-    pr.enable()
+def __orig_main(args):
+    if args.profile:
+        pr = cProfile.Profile()
+        pr.enable()
     tic = time.perf_counter()
-    args = parse_arguments()
 
     if os.path.exists(args.output_file):
         print(f'Error: {args.output_file} already exists.', file=sys.stderr)
@@ -39,7 +37,7 @@ def __orig_main():
         sys.exit(1)
 
     toc = time.perf_counter()
-    print(f'Parsing arguments took {toc - tic:.6f} seconds')
+    print(f'Checking the output file took {toc - tic:.6f} seconds')
     tic = toc
 
     df = pd.read_csv(args.csv_file)
@@ -61,18 +59,28 @@ def __orig_main():
     toc = time.perf_counter()
     print(f'Writing the file took {toc - tic:.6f} seconds')
 
-    pr.disable()
-    stats = pstats.Stats(pr)
-    stats.sort_stats('cumtime').print_stats(10)
+    if args.profile:
+        pr.disable()
+        stats = pstats.Stats(pr)
+        stats.sort_stats('cumtime').print_stats(10)
 
 
 def main():
     """Main function."""
+    args = parse_arguments()
+    if not args.profile:
+        __orig_main(args)
+        return
+
+    # line_profiler is only imported when profiling, as it is not needed to
+    # calculate the volumes
+    from line_profiler import LineProfiler
+
     profiler = LineProfiler()
     profiler.add_function(calculate_stem_volumes)
     profiler.add_function(__orig_main)
     profiler_wrapper = profiler(__orig_main)
-    profiler_wrapper()
+    profiler_wrapper(args)
     profiler.print_stats()
 
 
@@ -83,6 +91,8 @@ def parse_arguments():
         Namespace: An argparse.Namespace object containing the parsed arguments:
             - csv_file (str): Path to the input CSV file.
             - output_file (str): Path to the output CSV file where results will be saved.
+            - profile (bool): Whether to profile the run with cProfile and
+              line_profiler.
     """
     parser = argparse.ArgumentParser(
         description='Calculate stem volumes for given CSV file'
@@ -93,10 +103,14 @@ def parse_arguments():
     parser.add_argument(
         'output_file', help='Path to CSV file to save the added results in.'
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print cProfile and line_profiler statistics of the run.',
+    )
     return parser.parse_args()
 
 
-# @lru_cache(maxsize=None)
 def get_formula_metadata(formula_no: int):
     """Returns metadata about a stem volume formula by its number.
 
@@ -110,55 +124,36 @@ def get_formula_metadata(formula_no: int):
             - A tuple of the parameter names.
             - A tuple of the parameter units.
             - The unit of the stem volume returned by the formula.
+
+    Raises:
+        ValueError: If there is no formula with the given number.
     """
-    func_name = f'stem_volume_formula_{formula_no}'
-    func = getattr(stem_volumes.formulas, func_name)
+    if not 1 <= formula_no <= len(FORMULAS):
+        raise ValueError(
+            f'formula_no must be between 1 and {len(FORMULAS)}, '
+            f'got {formula_no}'
+        )
+    func = FORMULAS[formula_no - 1]
+    func_name = func.__name__
     params = tuple(signature(func).parameters)
     param_units = tuple(extract_parameter_units(func))
     vol_unit = extract_volume_unit(func)
     return func_name, func, params, param_units, vol_unit
 
 
-# @lru_cache(maxsize=None)
-def get_conversion_factor(from_unit: str, to_unit: str) -> float:
-    """Returns the conversion factor to convert a measurement from one unit to another.
-
-    Args:
-        from_unit: The unit of the original measurement ('mm', 'cm', 'dm', 'm').
-        to_unit: The unit to convert the measurement to ('mm', 'cm', 'dm', 'm').
+def _apply_formula_cached(func_name, d=None, h=None):
+    """Apply formula with precomputed unit conversions and safe fallback.
 
-    Returns:
-        The conversion factor to apply to the original measurement.
+    The diameter d in mm and the height h in dm are passed positionally to the
+    formula, converted by the factors of FORMULA_SPECS_BY_NAME.
     """
-    unit_conversion_factors = {'mm': 0.001, 'cm': 0.01, 'dm': 0.1, 'm': 1}
-    return unit_conversion_factors[from_unit] / unit_conversion_factors[to_unit]
-
-
-# @lru_cache(maxsize=None)
-def _apply_formula_cached(
-    func_name,
-    *,
-    d=None,
-    h=None,
-    param_unit_D=None,
-    param_unit_H=None,
-    vol_unit=None,
-    params=(),
-):
-    """Apply formula with cached unit conversions and safe fallback."""
     try:
-        func = getattr(stem_volumes.formulas, func_name)
+        func, d_factor, h_factor, vol_unit = FORMULA_SPECS_BY_NAME[func_name]
         args = []
-
-        # Convert diameter if used
-        if 'D' in params and d is not None:
-            d_conv = get_conversion_factor('mm', param_unit_D)
-            args.append(d * d_conv)
-
-        # Convert height if used
-        if 'H' in params and h is not None:
-            h_conv = get_conversion_factor('dm', param_unit_H)
-            args.append(h * h_conv)
+        if d_factor is not None and d is not None:
+            args.append(d * d_factor)
+        if h_factor is not None and h is not None:
+            args.append(h * h_factor)
 
         volume = func(*args)
         return convert_volume_to_m3(volume, vol_unit)
@@ -174,18 +169,14 @@ def compute_volume_for_row(args):
         - The name of the stem volume formula function to use.
         - The diameter of the tree in mm.
         - The height of the tree in dm.
-        - The unit of the diameter in the formula.
-        - The unit of the height in the formula.
-        - The unit of the stem volume returned by the formula.
-        - A tuple of the parameter names used by the formula.
+
+    The units are converted by the factors precomputed in
+    FORMULA_SPECS_BY_NAME.
 
     Returns a tuple of the index and the computed stem volume in m3.
     """
-    i, func_name, d, h, param1_unit, param2_unit, vol_unit, param_names = args
-    val = _apply_formula_cached(
-        func_name, d, h, param1_unit, param2_unit, vol_unit, param_names
-    )
-    return i, val
+    i, func_name, d, h = args
+    return i, _apply_formula_cached(func_name, d, h)
 
 
 def process_chunk(
@@ -213,27 +204,33 @@ def process_chunk(
         for func_name in allowed:
             if func_name not in all_formulas:
                 continue
-            params, param_units, vol_unit = all_formulas[func_name]
-            val = _apply_formula_cached(
-                func_name,
-                d,
-                h if len(params) > 1 else None,
-                param_units[0],
-                param_units[1] if len(params) > 1 else None,
-                vol_unit,
-                params,
-            )
+            val = _apply_formula_cached(func_name, d, h)
             row_result[f'{func_name} [m3]'] = val
         chunk_results.append(row_result)
     return pd.DataFrame(chunk_results, index=range(start, end))
 
 
+# Formula functions and unit conversion factors by name, resolved once
+# instead of converting units per call
+FORMULA_SPECS_BY_NAME = {spec[0].__name__: spec for spec in FORMULA_SPECS}
+
 # Precompute all formula metadata at import time
 ALL_FORMULAS = {
     f'stem_volume_formula_{formula_no}': get_formula_metadata(formula_no)[2:]
     for formula_no in range(1, 231)
 }
 
+# Column indices (formula number - 1) of the formulas of each species, resolved
+# once instead of looking up the formulas by name per species
+SPECIES_FORMULA_INDICES = {
+    species: tuple(
+        int(func_name.rsplit('_', 1)[1]) - 1
+        for func_name in func_names
+        if func_name in ALL_FORMULAS
+    )
+    for species, func_names in species_to_formulas.items()
+}
+
 ROW_THRESHOLD = (
     1000  # Threshold for switching between row-wise and vectorized processing
 )
@@ -263,64 +260,56 @@ def _calculate_stem_volumes_rowwise(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
 
     # Use precomputed metadata
-    all_formulas = ALL_FORMULAS
-    formula_names = list(all_formulas.keys())
-
-    # Precompute allowed formulas as a DataFrame (rows: trees, cols: formulas)
-    allowed_sets = df['species'].apply(
-        lambda sp: set(species_to_formulas.get(sp.lower(), []))
-        if isinstance(sp, str)
-        else set()
+    formula_names = list(ALL_FORMULAS)
+
+    # Precompute allowed formulas per distinct species and broadcast them to
+    # the trees (rows: trees, cols: formulas). Trees without a species get the
+    # code -1 and thus the last row, which allows no formula. The cast to
+    # 'string' keeps the .str accessor working for columns without strings.
+    codes, species_names = pd.factorize(
+        df['species'].astype('string').str.lower()
     )
-    allowed_mask = pd.DataFrame(
-        [[fn in allowed for fn in formula_names] for allowed in allowed_sets],
-        columns=formula_names,
-        index=df.index,
+    species_allowed = np.zeros(
+        (len(species_names) + 1, len(formula_names)), dtype=bool
     )
+    for code, species in enumerate(species_names):
+        allowed = set(species_to_formulas.get(species, []))
+        species_allowed[code] = [fn in allowed for fn in formula_names]
+    allowed_mask = species_allowed[codes]
 
-    # Prepare results DataFrame
-    results = pd.DataFrame(
-        pd.NA, index=df.index, columns=[f'{fn} [m3]' for fn in formula_names]
-    )
+    # Fill a single float array column by column and wrap it in a DataFrame at
+    # the end, instead of writing into a DataFrame per formula. Missing volumes
+    # are NaN, which keeps the columns float64 instead of object.
+    results = np.full((len(df), len(formula_names)), np.nan)
 
     diameter_raw = df['diameter at breast height [mm]'].to_numpy()
     height_raw = df['height [dm]'].to_numpy()
 
-    for j, func_name in enumerate(formula_names):
-        params, param_units, vol_unit = all_formulas[func_name]
-        mask = allowed_mask[func_name].to_numpy()
+    for j, (func, d_factor, h_factor, vol_unit) in enumerate(FORMULA_SPECS):
+        mask = allowed_mask[:, j]
         if not np.any(mask):
             continue
 
-        # Only compute for rows where mask is True
+        # Only compute for rows where mask is True, calling the NumPy-aware
+        # formula once on the arrays of all these rows, with the unit
+        # conversion factors precomputed at import time
         idx = np.where(mask)[0]
-        vals = []
-        for i in idx:
-            args = []
-            if 'D' in params:
-                args.append(diameter_raw[i])
-            if 'H' in params:
-                args.append(height_raw[i])
-            param_unit_D = (
-                param_units[params.index('D')] if 'D' in params else None
-            )
-            param_unit_H = (
-                param_units[params.index('H')] if 'H' in params else None
-            )
-
-            val = _apply_formula_cached(
-                func_name,
-                d=diameter_raw[i] if 'D' in params else None,
-                h=height_raw[i] if 'H' in params else None,
-                param_unit_D=param_unit_D,
-                param_unit_H=param_unit_H,
-                vol_unit=vol_unit,
-                params=params,
-            )
-
-            vals.append(val)
-        results.iloc[idx, j] = vals
+        args = []
+        if d_factor is not None:
+            args.append(diameter_raw[idx] * d_factor)
+        if h_factor is not None:
+            args.append(height_raw[idx] * h_factor)
+
+        try:
+            volumes = func(*args)
+            vals = convert_volume_to_m3(volumes, vol_unit)
+        except Exception:
+            vals = np.nan
+        results[idx, j] = vals
 
+    results = pd.DataFrame(
+        results, index=df.index, columns=[f'{fn} [m3]' for fn in formula_names]
+    )
     return pd.concat([df, results], axis=1)
 
 
@@ -338,69 +327,55 @@ def _calculate_stem_volumes_vectorized(df: pd.DataFrame) -> pd.DataFrame:
             species-specific formula, containing the computed stem volumes in m3.
     """
     df = df.copy()
-    diameter_col = 'diameter at breast height [mm]'
-    height_col = 'height [dm]'
-    species_col = 'species'
-
-    df[species_col] = df[species_col].str.lower().fillna('')
-
-    volume_results = {}
-
-    for species_name, group_df in df.groupby(species_col):
-        allowed_formulas = species_to_formulas.get(species_name, [])
-        if not allowed_formulas:
+    batch = TreeBatch.from_dataframe(df)
+    # The lowercase species of the batch, with '' for missing species
+    df['species'] = batch.species_names[batch.species]
+
+    # Fill a single array column by column, keeping track of the formulas
+    # used by any species, instead of writing into a Series per species
+    volumes = np.full((len(df), len(FORMULA_SPECS)), np.nan)
+    used = np.zeros(len(FORMULA_SPECS), dtype=bool)
+
+    # Sort the trees by species once, so that the trees of each species form
+    # a contiguous slice of the sort order
+    order = np.argsort(batch.species, kind='stable')
+    counts = np.bincount(batch.species, minlength=len(batch.species_names))
+    starts = np.cumsum(counts) - counts
+
+    for code, species_name in enumerate(batch.species_names):
+        formula_indices = SPECIES_FORMULA_INDICES.get(species_name)
+        if not formula_indices:
             continue
 
-        d = group_df[diameter_col].to_numpy()
-        h = group_df[height_col].to_numpy()
+        rows = order[starts[code] : starts[code] + counts[code]]
+        d = batch.D[rows]
+        h = batch.H[rows]
 
-        for func_name in allowed_formulas:
-            if func_name not in ALL_FORMULAS:
-                continue
-            params, param_units, vol_unit = ALL_FORMULAS[func_name]
-
-            # Unit conversion (robust to parameter order)
-            d_conv = (
-                get_conversion_factor('mm', param_units[params.index('D')])
-                if 'D' in params
-                else None
-            )
-            h_conv = (
-                get_conversion_factor('dm', param_units[params.index('H')])
-                if 'H' in params
-                else None
-            )
-
-            # Prepare arguments
+        for k in formula_indices:
+            func, d_factor, h_factor, vol_unit = FORMULA_SPECS[k]
             args = []
-            if 'D' in params:
-                args.append(d * d_conv)
-            if 'H' in params:
-                args.append(h * h_conv)
-
-            func = getattr(stem_volumes.formulas, func_name)
+            if d_factor is not None:
+                args.append(d * d_factor)
+            if h_factor is not None:
+                args.append(h * h_factor)
 
             try:
-                volumes = func(*args)  # NumPy-aware formula
-                volumes_m3 = convert_volume_to_m3(volumes, vol_unit)
+                volumes_m3 = convert_volume_to_m3(func(*args), vol_unit)
             except Exception:
-                volumes_m3 = np.full(len(group_df), pd.NA)
-
-            colname = f'{func_name} [m3]'
-            if colname not in volume_results:
-                volume_results[colname] = pd.Series(
-                    index=df.index, dtype='object'
-                )
-            volume_results[colname].loc[group_df.index] = volumes_m3
-
-    # Combine all new columns into a DataFrame and concatenate at once
-    results_df = pd.DataFrame(volume_results)
-    ordered_cols = [
-        f'stem_volume_formula_{i} [m3]'
-        for i in range(1, 231)
-        if f'stem_volume_formula_{i} [m3]' in results_df.columns
-    ]
-    results_df = results_df[ordered_cols]
+                volumes_m3 = np.nan
+            volumes[rows, k] = volumes_m3
+            used[k] = True
+
+    # Keep the columns of the used formulas, in the order of the formulas
+    results_df = pd.DataFrame(
+        volumes[:, used],
+        index=df.index,
+        columns=[
+            f'{func.__name__} [m3]'
+            for (func, *_), is_used in zip(FORMULA_SPECS, used)
+            if is_used
+        ],
+    )
 
     df = pd.concat([df, results_df], axis=1)
 
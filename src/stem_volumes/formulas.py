@@ -4,6 +4,10 @@ The different formulas are based on Appendix B (starting on page 44) and
 Appendix C (starting page 52) of the monograph. It can be downloaded at
 https://doi.org/10.14214/sf.sfm4. An Excel file covering Appendix B and C is
 avaiable at https://jukuri.luke.fi/handle/10024/512732.
+
+All formulas only use arithmetic operators and NumPy ufuncs. Therefore, they
+accept NumPy arrays of diameters and heights as well as scalars and calculate
+the volumes of many trees in a single call.
 """
 
 # use ln and log as in the Zianis paper (see table caption in Appendix C on
@@ -12,7 +16,19 @@ import numpy as np
 from numpy import exp, pi
 
 ln = np.log
-log = np.log10
+
+# constant factors of the formulas based on the basal area, computed once
+# instead of on every call
+_PI4 = pi / 4
+_PI40000 = pi / 40000
+
+# ln(10) to evaluate powers of 10 in log space
+_LN10 = ln(10)
+
+
+def _power_form(D, H, a, b, d):
+    """Calculates a * D**b * H**d with a single exp instead of two powers."""
+    return a * exp(b * ln(D) + d * ln(H))
 
 
 def stem_volume_formula_1(D, H):
@@ -38,11 +54,15 @@ def stem_volume_formula_1(D, H):
     d = -1.8997
     e = -0.9739
 
-    # Implement formula
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
+# exp(c) with c = -2.45224 of formula 2
+_EXP_C2 = exp(-2.45224)
+
+
 def stem_volume_formula_2(D, H):
     """Calculate the stem volume of a tree based on diameter and height.
 
@@ -61,11 +81,8 @@ def stem_volume_formula_2(D, H):
     # Define parameters
     a = 1.77220
     b = 0.96736
-    c = -2.45224
-    # Implement formula
-    V = (
-        (D**a) * (H**b) * exp(c)
-    )  # Formula - Abies grandis (Grand fir)(Netherland)
+    # Implement formula - Abies grandis (Grand fir)(Netherland)
+    V = _power_form(D, H, _EXP_C2, a, b)
     return V
 
 
@@ -89,8 +106,8 @@ def stem_volume_formula_3(D, H):
     d = -1.8997
     e = -0.9739
 
-    # Formula implementation
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -138,10 +155,10 @@ def stem_volume_formula_5(D, H):
     f = 19.661
     g = -2.4584
 
-    V = (pi / 4) * (
-        a * D**2 * H
-        + b * D**2 * H * ln(D) ** 2
-        + c * D**2
+    V = _PI4 * (
+        a * D * D * H
+        + b * D * D * H * ln(D) ** 2
+        + c * D * D
         + d * D * H
         + e * H
         + f * D
@@ -175,8 +192,8 @@ def stem_volume_formula_6(D: float, H: float) -> float:
     d = 0.033210
 
     # Calculate volume
-    V = (pi / 4) * (
-        a * D**2 * H + b * D**2 * H * ln(D) ** 2 + c * D**2 + d * D * H
+    V = _PI4 * (
+        a * D * D * H + b * D * D * H * ln(D) ** 2 + c * D * D + d * D * H
     )
     return V
 
@@ -200,7 +217,12 @@ def stem_volume_formula_7(D, H):
     c = -0.1067
     d = 0.938
     e = 0.0228
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -226,7 +248,12 @@ def stem_volume_formula_8(D, H):
     d = -0.4155
     e = 0.5455
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -255,10 +282,15 @@ def stem_volume_formula_9(D, H):
     e = 0.00077115
     f = 0.000029836
 
-    V = a + b * D + c * (D**2) + d * (D**3) + e * H + f * (D**2) * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
+# exp(c) with c = -2.94253 of formula 10
+_EXP_C10 = exp(-2.94253)
+
+
 def stem_volume_formula_10(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -274,8 +306,7 @@ def stem_volume_formula_10(D, H):
     """
     a = 1.89756
     b = 0.97716
-    c = -2.94253
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C10, a, b)
     return V
 
 
@@ -302,7 +333,12 @@ def stem_volume_formula_11(D, H):
     e = 0.021
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
 
     # Return the calculated volume
     return V
@@ -324,7 +360,7 @@ def stem_volume_formula_12(D, H):
     a = -0.012668
     b = 7.37e-05
     c = 0.75
-    V = a + b * D**2 * H**c
+    V = a + b * D * D * H**c
     return V
 
 
@@ -346,10 +382,19 @@ def stem_volume_formula_13(D, H):
     c = 0.1001
     d = -0.499
     e = 0.5902
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
+# exp(c) with c = -2.5222 of formula 14
+_EXP_C14 = exp(-2.5222)
+
+
 def stem_volume_formula_14(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -365,8 +410,7 @@ def stem_volume_formula_14(D, H):
     """
     a = 1.85749
     b = 0.88675
-    c = -2.5222
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C14, a, b)
     return V
 
 
@@ -386,7 +430,7 @@ def stem_volume_formula_15(D, H):
     a = 8.6524
     b = 0.076844
     c = 0.031573
-    V = a + b * D**2 + c * D**2 * H
+    V = a + b * D * D + c * D * D * H
     return V
 
 
@@ -411,7 +455,7 @@ def stem_volume_formula_16(D, H):
     c = 0.029679
     d = 0.004341
 
-    V = a + b * D**2 + c * D**2 * H + d * H**2 * D
+    V = a + b * D * D + c * D * D * H + d * H * H * D
     return V
 
 
@@ -441,7 +485,13 @@ def stem_volume_formula_17(D, H):
     e = 0.000499
 
     # implement formula
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * D * H + e * D**2 * H**2
+    V = (
+        a * D * D
+        + b * D * D * H
+        + c * D * H * H
+        + d * D * H
+        + e * D * D * H * H
+    )
     return V
 
 
@@ -464,7 +514,8 @@ def stem_volume_formula_18(D, H):
     a = 0.05437
     b = 1.94505
     c = 0.92947
-    v = a * (D**b) * (H**c)  # Alnus glutinosa (Black alder, Klibbal)(Sweden)
+    # Alnus glutinosa (Black alder, Klibbal)(Sweden)
+    v = _power_form(D, H, a, b, c)
     return v
 
 
@@ -486,7 +537,13 @@ def stem_volume_formula_19(D, H):
     c = 0.007665
     d = -0.06669
     e = 0.000428
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * D * H + e * D**2 * H**2
+    V = (
+        a * D * D
+        + b * D * D * H
+        + c * D * H * H
+        + d * D * H
+        + e * D * D * H * H
+    )
     return V
 
 
@@ -509,7 +566,7 @@ def stem_volume_formula_20(D, H):
     d = 0.0138
     e = -0.06311
 
-    V = a + b * D**2 + c * D**2 * H + d * H**2 * D + e * H**2
+    V = a + b * D * D + c * D * D * H + d * H * H * D + e * H * H
     return V
 
 
@@ -535,7 +592,12 @@ def stem_volume_formula_21(D, H):
     d = 0.801
     e = 0.0530
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -563,7 +625,7 @@ def stem_volume_formula_22(D: float, H: float) -> float:
     c = 0.04407
 
     # Calculate volume
-    V = (pi / 4) * (a * D**2 * H + b * D**2 + c * D)
+    V = _PI4 * (a * D * D * H + b * D * D + c * D)
     return V
 
 
@@ -581,10 +643,14 @@ def stem_volume_formula_23(D):
     """
     a = -0.5547
     b = 0.3757
-    V = a + b * D**2
+    V = a + b * D * D
     return V
 
 
+# exp(c) with c = -1.07055 of formula 24
+_EXP_C24 = exp(-1.07055)
+
+
 def stem_volume_formula_24(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -603,9 +669,8 @@ def stem_volume_formula_24(D, H):
     # coefficients
     a = 1.89060
     b = 0.26595
-    c = -1.07055
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C24, a, b)
     return V
 
 
@@ -632,7 +697,8 @@ def stem_volume_formula_25(D, H):
     e = -0.00059573
     f = 0.000030409
 
-    V = a + b * D + c * (D**2) + d * (D**3) + e * H + f * (D**2) * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -690,6 +756,11 @@ def stem_volume_formula_27(D):
     return V
 
 
+# ln of the coefficients a = 0.011197 and c = 0.986 of formula 28
+_LN_A28 = ln(0.011197)
+_LN_C28 = ln(0.986)
+
+
 def stem_volume_formula_28(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -703,12 +774,13 @@ def stem_volume_formula_28(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = 0.011197
     b = 2.10253
-    c = 0.986
     d = 3.98519
     e = -2.659
-    V = a * D**b * c**D * H**d * (H - 1.3) ** e
+
+    # c**D is evaluated as exp(D * ln(c)) and combined with the other
+    # factors into a single exp
+    V = exp(_LN_A28 + b * ln(D) + _LN_C28 * D + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -758,7 +830,7 @@ def stem_volume_formula_30(D, H):
     c = 0.01283
     d = 0.01380
     e = 0.06311
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2 + e * H**2
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
@@ -785,7 +857,7 @@ def stem_volume_formula_31(D, H):
     c = 0.02849
     d = 0.00885
     e = -0.00799
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2 + e * H**2
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
@@ -810,7 +882,12 @@ def stem_volume_formula_32(D, H):
     d = 0.1946
     e = 0.4147
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -837,7 +914,7 @@ def stem_volume_formula_33(D, H):
     d = -0.05606
 
     # Implement formula
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * H**2
+    V = a * D * D + b * D * D * H + c * D * H * H + d * H * H
     return V
 
 
@@ -867,6 +944,10 @@ def stem_volume_formula_34(D, H):
     return v
 
 
+# ln(10**a) with a = -0.93631 of formula 35
+_LN_K35 = -0.93631 * _LN10
+
+
 def stem_volume_formula_35(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -880,15 +961,19 @@ def stem_volume_formula_35(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -0.93631
     b = 2.30212
     c = -1.40378
     d = 8.01817
     e = -6.18825
-    V = 10**a * (D**b) * ((D + 20) ** c) * (H**d) * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K35 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -0.44224 of formula 36
+_LN_K36 = -0.44224 * _LN10
+
+
 def stem_volume_formula_36(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -902,16 +987,20 @@ def stem_volume_formula_36(D, H):
     Returns:
         V: Stem volume in dm3.
     """
-    a = -0.44224
     b = 2.47580
     c = -1.40854
     d = 5.16863
     e = -3.77147
 
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K36 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -0.35394 of formula 37
+_LN_K37 = -0.35394 * _LN10
+
+
 def stem_volume_formula_37(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -928,13 +1017,13 @@ def stem_volume_formula_37(D, H):
     Returns:
         V: Stem volume in dm3.
     """
-    a = -0.35394
     b = 2.52141
     c = -1.54257
     d = 4.88165
     e = -3.47422
 
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K37 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -963,7 +1052,7 @@ def stem_volume_formula_38(D: float, H: float) -> float:
     d = -0.06630
 
     # Calculate volume
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * H
+    V = a * D * D + b * D * D * H + c * D * H * H + d * H
 
     return V
 
@@ -984,7 +1073,7 @@ def stem_volume_formula_39(D, H):
     a = -0.009184
     b = 6.73e-05
     c = 0.75
-    V = a + b * D**2 * H**c
+    V = a + b * D * D * H**c
     return V
 
 
@@ -1009,7 +1098,7 @@ def stem_volume_formula_40(D, H):
     c = 0.001411006
     d = 0.60291075
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -1034,7 +1123,7 @@ def stem_volume_formula_41(D, H):
     c = -0.01120638
     d = 0.60291075
 
-    V = a * (D ** (b + c)) * (H**d)
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -1055,10 +1144,14 @@ def stem_volume_formula_42(D, H):
     b = 2.258957614
     c = -0.00956695
     d = 0.60291075
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
+# exp(c) with c = -2.33706 of formula 43
+_EXP_C43 = exp(-2.33706)
+
+
 def stem_volume_formula_43(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -1077,10 +1170,9 @@ def stem_volume_formula_43(D, H):
     # Define the coefficients
     a = 1.85298
     b = 0.86717
-    c = -2.33706
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C43, a, b)
 
     # Return the calculated volume
     return V
@@ -1104,7 +1196,7 @@ def stem_volume_formula_44(D, H):
     c = 0.01283
     d = 0.0138
     e = -0.06311
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2 + e * H**2
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
@@ -1130,10 +1222,10 @@ def stem_volume_formula_45(D, H):
     e = 0.219462
     f = 49.6136
     g = -22.372
-    V = (pi / 4) * (
-        a * D**2 * H
-        + b * D**2 * H * ln(D) ** 2
-        + c * D**2
+    V = _PI4 * (
+        a * D * D * H
+        + b * D * D * H * ln(D) ** 2
+        + c * D * D
         + d * D * H
         + e * H
         + f * D
@@ -1160,7 +1252,7 @@ def stem_volume_formula_46(D, H):
     b = -13.62144
     c = 9.9888
 
-    V = (pi / 4) * (a * D**2 * H + b * D**2 + c * D)
+    V = _PI4 * (a * D * D * H + b * D * D + c * D)
     return V
 
 
@@ -1182,8 +1274,11 @@ def stem_volume_formula_47(D, H):
     c = 0.2127
     d = 1.1992
     e = -0.0584
-    V = a * 10 ** (
-        b * log(D) + c * log(D) ** 2 + d * log(H) + e * (log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
     )
     return V
 
@@ -1208,7 +1303,7 @@ def stem_volume_formula_48(D, H):
     b = 0.0000748
     c = 0.75
 
-    V = a + b * D**2 * H**c
+    V = a + b * D * D * H**c
     return V
 
 
@@ -1238,7 +1333,8 @@ def stem_volume_formula_49(D, H):
     f = 3.9837 * 10 ** (-5)
 
     # Implement formula
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -1262,7 +1358,7 @@ def stem_volume_formula_50(D, H):
     b = 0.00001696
     c = 0.00001883
     # Implement formula
-    V = a * b * D * (H**2) + c * (D**3)
+    V = a * b * D * (H * H) + c * (D * D * D)
     return V
 
 
@@ -1283,10 +1379,14 @@ def stem_volume_formula_51(D, H):
     b = 0.00072179
     c = 2.52e-06
 
-    V = a + b * D * H**2 + c * D**3
+    V = a + b * D * H * H + c * D * D * D
     return V
 
 
+# exp(c) with c = -3.57875 of formula 52
+_EXP_C52 = exp(-3.57875)
+
+
 def stem_volume_formula_52(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -1302,9 +1402,8 @@ def stem_volume_formula_52(D, H):
     """
     a = 1.55448
     b = 1.55880
-    c = -3.57875
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C52, a, b)
     return V
 
 
@@ -1328,7 +1427,7 @@ def stem_volume_formula_53(D, H):
     b = 1.78189
     c = 1.08345
 
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -1359,11 +1458,16 @@ def stem_volume_formula_54(D: float, H: float) -> float:
     f = 3.7872 * 10**-5
 
     # Calculate volume
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
 
     return V
 
 
+# exp(c) with c = -2.48079 of formula 55
+_EXP_C55 = exp(-2.48079)
+
+
 def stem_volume_formula_55(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -1379,9 +1483,8 @@ def stem_volume_formula_55(D, H):
     """
     a = 1.9577
     b = 0.7706
-    c = -2.48079
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C55, a, b)
     return V
 
 
@@ -1405,7 +1508,7 @@ def stem_volume_formula_56(D, H):
     b = 0.03310
     c = 0.04127
 
-    V = a * D**2 * H + b * D**2 + c * D * H
+    V = a * D * D * H + b * D * D + c * D * H
     return V
 
 
@@ -1433,7 +1536,7 @@ def stem_volume_formula_57(D, H):
     b = 0.03310
     c = 0.04127
 
-    V = a * (D**2) * H + b * (D**2) + c * D * H
+    V = a * (D * D) * H + b * (D * D) + c * D * H
     return V
 
 
@@ -1453,7 +1556,7 @@ def stem_volume_formula_58(D, H):
     a = 0.06328
     b = 1.92428
     c = 0.8869
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -1478,7 +1581,7 @@ def stem_volume_formula_59(D, H):
     c = 0.03892
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * D**2 * H + b * D**2 + c * D * H
+    V = a * D * D * H + b * D * D + c * D * H
 
     # Return the calculated volume
     return V
@@ -1500,7 +1603,7 @@ def stem_volume_formula_60(D, H):
     a = 0.03453
     b = 0.02941
     c = 0.03892
-    V = a * D**2 * H + b * D**2 + c * D * H
+    V = a * D * D * H + b * D * D + c * D * H
     return V
 
 
@@ -1522,7 +1625,7 @@ def stem_volume_formula_61(D, H):
     c = 0.01283
     d = 0.0138
     e = -0.06311
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2 + e * H**2
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
@@ -1545,7 +1648,12 @@ def stem_volume_formula_62(D, H):
     d = 0.4929
     e = 0.0962
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -1565,7 +1673,7 @@ def stem_volume_formula_63(D, H):
     a = -0.012107
     b = 7.77e-05
     c = 0.75
-    V = a + b * D**2 * H**c
+    V = a + b * D * D * H**c
     return V
 
 
@@ -1592,10 +1700,10 @@ def stem_volume_formula_64(D, H):
     f = 36.9783
     g = -14.204
 
-    V = (pi / 4) * (
-        a * D**2 * H
-        + b * D**2 * H * ln(D) ** 2
-        + c * D**2
+    V = _PI4 * (
+        a * D * D * H
+        + b * D * D * H * ln(D) ** 2
+        + c * D * D
         + d * D * H
         + e * H
         + f * D
@@ -1626,7 +1734,7 @@ def stem_volume_formula_65(D, H):
     c = 5.9995
 
     # Implement formula
-    V = (pi / 4) * (a * D**2 * H + b * D**2 + c * D)
+    V = _PI4 * (a * D * D * H + b * D * D + c * D)
     return V
 
 
@@ -1651,10 +1759,15 @@ def stem_volume_formula_66(D, H):
     d = -3.8178e-6
     e = -0.0011638
     f = 4.0597e-5
-    V = a + b * D + c * (D**2) + d * (D**3) + e * H + f * (D**2) * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
+# exp(c) with c = -3.0488 of formula 67
+_EXP_C67 = exp(-3.0488)
+
+
 def stem_volume_formula_67(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -1670,9 +1783,8 @@ def stem_volume_formula_67(D, H):
     """
     a = 1.8667
     b = 1.08118
-    c = -3.0488
 
-    return D**a * H**b * exp(c)
+    return _power_form(D, H, _EXP_C67, a, b)
 
 
 def stem_volume_formula_68(D, H):
@@ -1694,7 +1806,8 @@ def stem_volume_formula_68(D, H):
     d = -2.3179
     e = -0.8236
 
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -1720,10 +1833,15 @@ def stem_volume_formula_69(D, H):
     d = -2.3179
     e = -0.8236
 
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
+# exp(c) with c = -2.8748 of formula 70
+_EXP_C70 = exp(-2.8748)
+
+
 def stem_volume_formula_70(D: float, H: float) -> float:
     """Calculate the stem volume of a tree based on diameter and height.
 
@@ -1745,10 +1863,9 @@ def stem_volume_formula_70(D: float, H: float) -> float:
     # Define coefficients
     a = 1.87077
     b = 1.00616
-    c = -2.8748
 
     # Calculate volume
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C70, a, b)
 
     return V
 
@@ -1771,7 +1888,8 @@ def stem_volume_formula_71(D, H):
     c = 1.9741
     d = -2.1902
     e = -0.8459
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -1795,7 +1913,8 @@ def stem_volume_formula_72(D, H):
     b = 1.7574
     c = 0.9808
 
-    V = exp(a) * D**b * H**c
+    # exp(a) * D**b * H**c with a single exp
+    V = exp(a + b * ln(D) + c * ln(H))
     return V
 
 
@@ -1821,7 +1940,8 @@ def stem_volume_formula_73(D, H):
     b = 1.8105
     c = 0.9908
 
-    V = exp(a) * (D**b) * (H**c)
+    # exp(a) * D**b * H**c with a single exp
+    V = exp(a + b * ln(D) + c * ln(H))
     return V
 
 
@@ -1850,7 +1970,7 @@ def stem_volume_formula_74(D, H):
     a = 0.0983
     b = 1.551
     c = 1.1483
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -1881,7 +2001,8 @@ def stem_volume_formula_75(D, H):
     e = -0.8236
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
 
     # Return the calculated volume
     return V
@@ -1904,7 +2025,7 @@ def stem_volume_formula_76(D, H):
     b = 0.0753
     c = 0.03345
     d = -0.00243
-    V = a + b * D**2 + c * D**2 * H + d * H**2 * D
+    V = a + b * D * D + c * D * D * H + d * H * H * D
     return V
 
 
@@ -1925,7 +2046,7 @@ def stem_volume_formula_77(D, H):
     b = -0.01
     c = 0.03355
     d = -0.00359
-    V = a + b * D**2 + c * D**2 * H + d * H**2 * D
+    V = a + b * D * D + c * D * D * H + d * H * H * D
     return V
 
 
@@ -1947,7 +2068,7 @@ def stem_volume_formula_78(D, H):
     c = 0.003292718
     d = 0.76283925
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -1969,7 +2090,7 @@ def stem_volume_formula_79(D, H):
     c = -0.1054168
     d = 0.76283925
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -1994,7 +2115,7 @@ def stem_volume_formula_80(D, H):
     c = -0.0026067
     d = 0.76283925
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -2023,7 +2144,12 @@ def stem_volume_formula_81(D, H):
     e = 0.0129
 
     # Implement formula
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -2051,10 +2177,10 @@ def stem_volume_formula_82(D, H):
     e = -0.28875
     f = 28.279
     # Implement formula
-    v = (pi / 4) * (
-        a * D**2 * H
-        + b * D**2 * H * (ln(D)) ** 2
-        + c * D**2
+    v = _PI4 * (
+        a * D * D * H
+        + b * D * D * H * (ln(D)) ** 2
+        + c * D * D
         + d * D * H
         + e * H
         + f * D
@@ -2079,8 +2205,8 @@ def stem_volume_formula_83(D, H):
     b = -0.12731
     c = -8.55022
     d = 7.6331
-    V = (pi / 4) * (
-        a * D**2 * H + b * D**2 * H * (ln(D) ** 2) + c * D**2 + d * D
+    V = _PI4 * (
+        a * D * D * H + b * D * D * H * (ln(D) ** 2) + c * D * D + d * D
     )
     return V
 
@@ -2105,7 +2231,8 @@ def stem_volume_formula_84(D, H):
     e = -0.0027922
     f = 0.00004834610
 
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -2154,7 +2281,7 @@ def stem_volume_formula_86(D: float, H: float) -> float:
     b = 0.87852
 
     # Calculate volume
-    V = a * (H * D**2) ** b
+    V = a * (H * D * D) ** b
 
     return V
 
@@ -2203,6 +2330,11 @@ def stem_volume_formula_88(D):
     return V
 
 
+# ln of the coefficients a = 0.022927 and c = 0.99146 of formula 89
+_LN_A89 = ln(0.022927)
+_LN_C89 = ln(0.99146)
+
+
 def stem_volume_formula_89(D, H):
     """Calculate the volume of the stem of a standing tree.
 
@@ -2219,13 +2351,13 @@ def stem_volume_formula_89(D, H):
     Returns:
         V: Stem volume in dm3
     """
-    a = 0.022927
     b = 1.91505
-    c = 0.99146
     d = 2.82541
     e = -1.53547
 
-    V = a * (D**b) * (c**D) * (H**d) * ((H - 1.3) ** e)
+    # c**D is evaluated as exp(D * ln(c)) and combined with the other
+    # factors into a single exp
+    V = exp(_LN_A89 + b * ln(D) + _LN_C89 * D + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -2297,7 +2429,7 @@ def stem_volume_formula_91(D, H):
     c = 0.79465
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
 
     # Return the calculated volume
     return V
@@ -2319,7 +2451,7 @@ def stem_volume_formula_92(D, H):
     a = 0.10838
     b = 1.8202
     c = 0.77154
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -2356,7 +2488,7 @@ def stem_volume_formula_94(D, H):
         V: The calculated stem volume in m3.
     """
     a = 0.502
-    V = a * H * D**2
+    V = a * H * D * D
     return V
 
 
@@ -2374,7 +2506,7 @@ def stem_volume_formula_95(D, H):
         V: The calculated stem volume in m3.
     """
     a = 0.418
-    V = a * H * D**2
+    V = a * H * D * D
     return V
 
 
@@ -2400,7 +2532,7 @@ def stem_volume_formula_96(D, H):
     b = 1.6834
     c = 0.8598
 
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -2426,7 +2558,7 @@ def stem_volume_formula_97(D, H):
     d = 0.54879808
 
     # Implement formula
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -2450,7 +2582,7 @@ def stem_volume_formula_98(D, H):
     b = 2.164126647
     c = -0.04670018
     d = 0.54879808
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -2471,10 +2603,14 @@ def stem_volume_formula_99(D, H):
     b = 2.164126647
     c = -0.0102582
     d = 0.54879808
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
+# exp(c) with c = -2.75863 of formula 100
+_EXP_C100 = exp(-2.75863)
+
+
 def stem_volume_formula_100(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -2490,9 +2626,8 @@ def stem_volume_formula_100(D, H):
     """
     a = 1.75055
     b = 1.10897
-    c = -2.75863
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C100, a, b)
     return V
 
 
@@ -2516,7 +2651,7 @@ def stem_volume_formula_101(D, H):
     b = 1.6704
     c = 1.3337
 
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -2545,8 +2680,8 @@ def stem_volume_formula_102(D: float, H: float) -> float:
     d = -1.7377
     e = -0.9756
 
-    # Calculate volume
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
 
     return V
 
@@ -2569,7 +2704,8 @@ def stem_volume_formula_103(D, H):
     c = 2.0714
     d = -1.4175
     e = -0.9601
-    V = a * H**b * (D) ** c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -2595,7 +2731,8 @@ def stem_volume_formula_104(D, H):
     d = -0.0594
     e = -0.7442
 
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -2621,7 +2758,7 @@ def stem_volume_formula_105(D, H):
     d = -0.10983
     e = 0.15195
 
-    V = a + b * (D**2) * H + c * D * (H**2) + d * (H**2) + e * D * H
+    V = a + b * (D * D) * H + c * D * (H * H) + d * (H * H) + e * D * H
     return V
 
 
@@ -2644,7 +2781,7 @@ def stem_volume_formula_106(D, H):
     d = 0.63
     e = -2.34
     f = 3.2
-    V = a + b * (D) * H**2 + c * H**2 + d * (D) * H + e * H + f * (D)
+    V = a + b * (D) * H * H + c * H * H + d * (D) * H + e * H + f * (D)
     return V
 
 
@@ -2678,7 +2815,7 @@ def stem_volume_formula_107(D, H):
     e = 0.28578
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
 
     # Return the calculated volume
     return V
@@ -2702,7 +2839,7 @@ def stem_volume_formula_108(D, H):
     c = 0.02853
     d = -0.31956
     e = 0.28969
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
     return V
 
 
@@ -2724,7 +2861,7 @@ def stem_volume_formula_109(D, H):
     c = 0.01521
     d = -0.18254
     e = 0.20994
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
     return V
 
 
@@ -2745,7 +2882,7 @@ def stem_volume_formula_110(D, H):
     b = 0.03023
     c = 0.00712
     d = 0.04175
-    V = a + b * D**2 * H + c * D * H**2 + d * D**2
+    V = a + b * D * D * H + c * D * H * H + d * D * D
     return V
 
 
@@ -2767,7 +2904,7 @@ def stem_volume_formula_111(D, H):
     c = 0.03053
     d = -0.50725
     e = 0.51643
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
     return V
 
 
@@ -2793,7 +2930,7 @@ def stem_volume_formula_112(D, H):
     d = -0.0977
     e = 0.14586
 
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
     return V
 
 
@@ -2821,7 +2958,7 @@ def stem_volume_formula_113(D, H):
     e = 0.31106
 
     # Implement formula
-    V = a + b * D**2 * H + c * D * H**2 + d * H**2 + e * D * H
+    V = a + b * D * D * H + c * D * H * H + d * H * H + e * D * H
     return V
 
 
@@ -2844,7 +2981,7 @@ def stem_volume_formula_114(D, H):
     a = 0.666151
     b = 0.458507
     # Implement formula
-    V = (pi / 40000) * H * D * (a + b * D)
+    V = _PI40000 * H * D * (a + b * D)
     return V
 
 
@@ -2863,7 +3000,7 @@ def stem_volume_formula_115(D, H):
     """
     a = 0.53005
     b = 1.229283
-    V = pi / 40000 * H * D * (a * D + b)
+    V = _PI40000 * H * D * (a * D + b)
     return V
 
 
@@ -2885,10 +3022,14 @@ def stem_volume_formula_116(D, H):
     c = 0.02022
     d = -0.05618
 
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * H**2
+    V = a * D * D + b * D * D * H + c * D * H * H + d * H * H
     return V
 
 
+# ln(10**a) with a = -0.9513 of formula 117
+_LN_K117 = -0.9513 * _LN10
+
+
 def stem_volume_formula_117(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -2905,16 +3046,20 @@ def stem_volume_formula_117(D, H):
     Returns:
         V: Stem volume in dm3.
     """
-    a = -0.9513
     b = 1.9781
     c = -0.5254
     d = 2.7604
     e = -1.4684
 
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K117 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -0.79783 of formula 118
+_LN_K118 = -0.79783 * _LN10
+
+
 def stem_volume_formula_118(D: float, H: float) -> float:
     """Calculate the stem volume of a tree based on diameter and height.
 
@@ -2934,18 +3079,21 @@ def stem_volume_formula_118(D: float, H: float) -> float:
         float: Stem volume in dm3.
     """
     # Define coefficients
-    a = -0.79783
     b = 2.07157
     c = -0.73882
     d = 3.16332
     e = -1.82622
 
-    # Calculate volume
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K118 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
 
     return V
 
 
+# ln(10**a) with a = -1.02039 of formula 119
+_LN_K119 = -1.02039 * _LN10
+
+
 def stem_volume_formula_119(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -2959,15 +3107,19 @@ def stem_volume_formula_119(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -1.02039
     b = 2.00128
     c = -0.47473
     d = 2.87138
     e = -1.61803
-    V = 10**a * (D**b) * ((D + 20) ** c) * (H**d) * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K119 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -0.82249 of formula 120
+_LN_K120 = -0.82249 * _LN10
+
+
 def stem_volume_formula_120(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -2984,16 +3136,20 @@ def stem_volume_formula_120(D, H):
         V: Stem volume in dm3.
     """
     # coefficients
-    a = -0.82249
     b = 2.11094
     c = -0.89626
     d = 3.51812
     e = -2.05567
 
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K120 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -1.06019 of formula 121
+_LN_K121 = -1.06019 * _LN10
+
+
 def stem_volume_formula_121(D, H):
     """Calculate the volume of the stem of a standing tree.
 
@@ -3010,13 +3166,13 @@ def stem_volume_formula_121(D, H):
     Returns:
         V: Stem volume in dm3
     """
-    a = -1.06019
     b = 2.04239
     c = -0.54292
     d = 2.80843
     e = -1.52110
 
-    V = (10**a) * (D**b) * ((D + 20) ** c) * (H**d) * ((H - 1.3) ** e)
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K121 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -3037,10 +3193,14 @@ def stem_volume_formula_122(D, H):
     b = 0.01925
     c = 0.01815
     d = -0.04936
-    V = a * D**2 + b * D**2 * H + c * D * H**2 + d * H**2
+    V = a * D * D + b * D * D * H + c * D * H * H + d * H * H
     return V
 
 
+# ln(10**a) with a = -1.0342 of formula 123
+_LN_K123 = -1.0342 * _LN10
+
+
 def stem_volume_formula_123(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3064,14 +3224,13 @@ def stem_volume_formula_123(D, H):
     #     raise ValueError("Height must be at least 2 m.")
 
     # Define the coefficients
-    a = -1.0342
     b = 1.9683
     c = -0.3850
     d = 2.4018
     e = -1.2075
 
-    # Calculate the volume according to the formula given by Zianis et al.
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K123 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
 
     # Return the calculated volume
     return V
@@ -3098,10 +3257,14 @@ def stem_volume_formula_124(D, H):
     a = 0.4693
     b = 1.311
     c = 0.781
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
+# exp(c) with c = -2.90893 of formula 125
+_EXP_C125 = exp(-2.90893)
+
+
 def stem_volume_formula_125(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3117,8 +3280,7 @@ def stem_volume_formula_125(D, H):
     """
     a = 1.78383
     b = 1.13397
-    c = -2.90893
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C125, a, b)
     return V
 
 
@@ -3140,7 +3302,8 @@ def stem_volume_formula_126(D, H):
     c = 1.9747
     d = -2.2905
     e = -0.6665
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -3163,7 +3326,8 @@ def stem_volume_formula_127(D, H):
     c = 1.9854
     d = -2.2816
     e = -0.7161
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -3187,7 +3351,8 @@ def stem_volume_formula_128(D, H):
     c = 1.1095
     d = -0.3895
 
-    V = a * D**b * (H - 1.3) ** c * (D + 40) ** d
+    # Calculate volume in log space, replacing the three powers by a single exp
+    V = a * exp(b * ln(D) + c * ln(H - 1.3) + d * ln(D + 40))
     return V
 
 
@@ -3215,8 +3380,13 @@ def stem_volume_formula_129(D, H):
     d = 0.6365
     e = 0.172
 
-    # Implement formula
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # Implement formula with natural logarithms, using log(x) = ln(x) / ln(10)
+    # and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -3244,7 +3414,7 @@ def stem_volume_formula_130(D, H):
     b = 1.7508
     c = 1.0228
     # Implement formula
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -3273,10 +3443,14 @@ def stem_volume_formula_131(D, H):
     a = 0.1491
     b = 1.6466
     c = 0.8325
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
+# exp(c) with c = -2.88614 of formula 132
+_EXP_C132 = exp(-2.88614)
+
+
 def stem_volume_formula_132(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3292,9 +3466,8 @@ def stem_volume_formula_132(D, H):
     """
     a = 1.89303
     b = 0.98667
-    c = -2.88614
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C132, a, b)
     return V
 
 
@@ -3320,7 +3493,13 @@ def stem_volume_formula_133(D, H):
     d = 0.09176
     e = 0.01249
 
-    V = a * D**2 + b * D**2 * H + c * D**2 * H**2 - d * D * H + e * D * H**2
+    V = (
+        a * D * D
+        + b * D * D * H
+        + c * D * D * H * H
+        - d * D * H
+        + e * D * H * H
+    )
     return V
 
 
@@ -3348,7 +3527,7 @@ def stem_volume_formula_134(D: float, H: float) -> float:
     c = 1.06964
 
     # Calculate volume
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
 
     return V
 
@@ -3372,10 +3551,20 @@ def stem_volume_formula_135(D, H):
     d = -0.07892
     e = -0.01049
 
-    V = a * D**2 + b * D**2 * H + c * D**2 * H**2 - d * D * H + e * D * H**2
+    V = (
+        a * D * D
+        + b * D * D * H
+        + c * D * D * H * H
+        - d * D * H
+        + e * D * H * H
+    )
     return V
 
 
+# exp(c) with c = -2.72505 of formula 136
+_EXP_C136 = exp(-2.72505)
+
+
 def stem_volume_formula_136(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3394,12 +3583,15 @@ def stem_volume_formula_136(D, H):
     # coefficients
     a = 1.89192
     b = 0.95374
-    c = -2.72505
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C136, a, b)
     return V
 
 
+# exp(c) with c = -2.7675 of formula 137
+_EXP_C137 = exp(-2.7675)
+
+
 def stem_volume_formula_137(D, H):
     """Calculate the volume of the stem of a standing tree.
 
@@ -3418,9 +3610,8 @@ def stem_volume_formula_137(D, H):
     """
     a = 1.95645
     b = 0.88671
-    c = -2.7675
 
-    V = (D**a) * (H**b) * exp(c)
+    V = _power_form(D, H, _EXP_C137, a, b)
     return V
 
 
@@ -3442,7 +3633,9 @@ def stem_volume_formula_138(D, H):
     c = 0.0102
     d = 0.0102
     e = 0.133
-    V = a * 10 ** (b * log(D) + c * log(D * D) + d * log(H) + e * log(H * H))
+    # log(D * D) = 2 * log(D) and log(H * H) = 2 * log(H). With
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10)), this becomes
+    V = a * exp((b + 2 * c) * ln(D) + (d + 2 * e) * ln(H))
     return V
 
 
@@ -3507,7 +3700,7 @@ def stem_volume_formula_141(D, H):
     c = -0.001926657
     d = 0.80636901
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -3528,7 +3721,7 @@ def stem_volume_formula_142(D, H):
     b = 2.066225947
     c = -0.07956244
     d = 0.80636901
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -3549,7 +3742,7 @@ def stem_volume_formula_143(D, H):
     b = 2.066225947
     c = 0.00369501
     d = 0.80636901
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -3573,7 +3766,8 @@ def stem_volume_formula_144(D, H):
     c = 5.21091
     d = 0.028702
 
-    V = (pi / 4) * (a * D**2 * H + b * D**2 * H * ln(D) ** 2 + c * D**2 + d * H)
+    ln_D = ln(D)
+    V = _PI4 * (a * D * D * H + b * D * D * H * ln_D * ln_D + c * D * D + d * H)
     return V
 
 
@@ -3625,7 +3819,8 @@ def stem_volume_formula_146(D, H):
     e = 0.000073997
     f = 0.0000091
     # Implement formula
-    V = a + b * D + c * (D**2) + d * (D**3) + e * H + f * (D**2) * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -3670,6 +3865,11 @@ def stem_volume_formula_148(D):
     return V
 
 
+# ln of the coefficients a = 0.036089 and c = 0.99676 of formula 149
+_LN_A149 = ln(0.036089)
+_LN_C149 = ln(0.99676)
+
+
 def stem_volume_formula_149(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3686,13 +3886,13 @@ def stem_volume_formula_149(D, H):
     Returns:
         V: Stem volume in dm3.
     """
-    a = 0.036089
     b = 2.01395
-    c = 0.99676
     d = 2.07025
     e = -1.07209
 
-    V = a * (D**b) * (c**D) * (H**d) * (H - 1.3) ** e
+    # c**D is evaluated as exp(D * ln(c)) and combined with the other
+    # factors into a single exp
+    V = exp(_LN_A149 + b * ln(D) + _LN_C149 * D + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -3743,7 +3943,7 @@ def stem_volume_formula_151(D, H):
     a = 0.0942
     b = 1.9671
     c = 0.7005
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -3767,7 +3967,7 @@ def stem_volume_formula_152(D, H):
     b = 1.9185
     c = 0.7381
 
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -3792,7 +3992,8 @@ def stem_volume_formula_153(D, H):
     c = -0.01092
     d = -0.01317
 
-    V = a * H * D**2 + b * D * H + c * D**3 + d * D * H**2
+    D2 = D * D
+    V = a * H * D2 + b * D * H + c * D2 * D + d * D * H * H
     return V
 
 
@@ -3812,7 +4013,7 @@ def stem_volume_formula_154(D, H):
     a = -2.37912
     b = 2.62903
     c = -0.000126
-    V = a + b * ln(D) + c * D**2
+    V = a + b * ln(D) + c * D * D
     # TODO
     # could also be
     # V = a + b * ln(D) + c * H**2
@@ -3851,7 +4052,7 @@ def stem_volume_formula_155(D, H):
     c = 0.894433
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
 
     # Return the calculated volume
     return V
@@ -3873,7 +4074,7 @@ def stem_volume_formula_156(D, H):
     a = 1.480589
     b = 1.982459514
     c = 0.742674501
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -3894,7 +4095,7 @@ def stem_volume_formula_157(D, H):
     b = 1.952764402
     c = -8.6651 * 10 ** (-5)
     d = 0.48560878
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -3916,7 +4117,7 @@ def stem_volume_formula_158(D, H):
     b = 1.952764402
     c = -0.11110535
     d = 0.48560878
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -3938,10 +4139,14 @@ def stem_volume_formula_159(D, H):
     b = 1.952764402
     c = 0.001095496
     d = 0.48560878
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
+# exp(c) with c = -2.8885 of formula 160
+_EXP_C160 = exp(-2.8885)
+
+
 def stem_volume_formula_160(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -3959,9 +4164,8 @@ def stem_volume_formula_160(D, H):
     """
     a = 1.82075
     b = 1.07427
-    c = -2.8885
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C160, a, b)
     return V
 
 
@@ -3988,8 +4192,8 @@ def stem_volume_formula_161(D, H):
     d = -1.0259
     e = -0.2640
 
-    # Implement formula
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -4014,7 +4218,8 @@ def stem_volume_formula_162(D, H):
     d = -1.3716
     e = -0.2663
     # Define parameters
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -4037,7 +4242,8 @@ def stem_volume_formula_163(D, H):
     c = 1.9912
     d = -3.6612
     e = -0.7502
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -4059,7 +4265,8 @@ def stem_volume_formula_164(D, H):
     b = 0.076844
     c = 0.031573
 
-    V = a + b * D**2 + c * D**2 * H
+    D2 = D * D
+    V = a + b * D2 + c * D2 * H
     return V
 
 
@@ -4084,7 +4291,8 @@ def stem_volume_formula_165(D, H):
     c = 0.029679
     d = 0.004341  # NOTE: parameter d listed in Zianis et al. for formula #166 belongs to formula #165 according to the original publication
 
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2
+    D2 = D * D
+    V = a + b * D2 + c * D2 * H + d * D * H * H
     return V
 
 
@@ -4112,7 +4320,8 @@ def stem_volume_formula_166(D: float, H: float) -> float:
     c = 0.036972
 
     # Calculate volume
-    V = a + b * D**2 + c * D**2 * H
+    D2 = D * D
+    V = a + b * D2 + c * D2 * H
 
     return V
 
@@ -4134,7 +4343,8 @@ def stem_volume_formula_167(D, H):
     a = 2.9121
     b = 0.039994
     c = -0.001091
-    V = a + b * D**2 + c * D**2 * H
+    D2 = D * D
+    V = a + b * D2 + c * D2 * H
     return V
 
 
@@ -4157,7 +4367,7 @@ def stem_volume_formula_168(D, H):
     a = 2.9361
     b = 0.038906
 
-    V = a + b * D**2 * H
+    V = a + b * D * D * H
     return V
 
 
@@ -4187,7 +4397,12 @@ def stem_volume_formula_169(D, H):
     d = 0.3115
     e = 0.3525
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -4208,10 +4423,15 @@ def stem_volume_formula_170(D, H):
     a = 0.1028
     b = 0.02705
     c = 0.005215
-    V = a * D**2 + b * D**2 * H + c * D * H**2
+    D2 = D * D
+    V = a * D2 + b * D2 * H + c * D * H * H
     return V
 
 
+# ln(10**a) with a = -1.1226 of formula 171
+_LN_K171 = -1.1226 * _LN10
+
+
 def stem_volume_formula_171(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -4235,19 +4455,22 @@ def stem_volume_formula_171(D, H):
     #     raise ValueError("Height must be at least 2 m.")
 
     # Define the coefficients
-    a = -1.1226
     b = 2.0180
     c = -0.2135
     d = 1.8271
     e = -0.8297
 
-    # Calculate the volume according to the formula given by Zianis et al.
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K171 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
 
     # Return the calculated volume
     return V
 
 
+# ln(10**a) with a = -1.20914 of formula 172
+_LN_K172 = -1.20914 * _LN10
+
+
 def stem_volume_formula_172(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -4261,15 +4484,19 @@ def stem_volume_formula_172(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -1.20914
     b = 1.9474
     c = -0.05947
     d = 1.40958
     e = -0.4581
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K172 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -1.38903 of formula 173
+_LN_K173 = -1.38903 * _LN10
+
+
 def stem_volume_formula_173(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -4283,15 +4510,19 @@ def stem_volume_formula_173(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -1.38903
     b = 1.84493
     c = 0.06563
     d = 2.02122
     e = -1.01095
-    V = 10**a * (D**b) * ((D + 20) ** c) * (H**d) * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K173 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -1.25246 of formula 174
+_LN_K174 = -1.25246 * _LN10
+
+
 def stem_volume_formula_174(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -4306,15 +4537,19 @@ def stem_volume_formula_174(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -1.25246
     b = 1.98244
     c = -0.13118
     d = 1.03781
     e = -0.03482
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K174 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
+# ln(10**a) with a = -1.52761 of formula 175
+_LN_K175 = -1.52761 * _LN10
+
+
 def stem_volume_formula_175(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -4329,12 +4564,12 @@ def stem_volume_formula_175(D, H):
     Returns:
         V: The calculated stem volume in dm3.
     """
-    a = -1.52761
     b = 1.82928
     c = 0.07454
     d = 1.43792
     e = -0.35559
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H - 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K175 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H - 1.3))
     return V
 
 
@@ -4358,10 +4593,15 @@ def stem_volume_formula_176(D, H):
     b = 0.02427
     c = 0.007315
 
-    V = a * D**2 + b * D**2 * H + c * D * H**2
+    D2 = D * D
+    V = a * D2 + b * D2 * H + c * D * H * H
     return V
 
 
+# ln(10**a) with a = -1.2605 of formula 177
+_LN_K177 = -1.2605 * _LN10
+
+
 def stem_volume_formula_177(D, H):
     """Calculate the stem volume for a standing tree.
 
@@ -4380,14 +4620,13 @@ def stem_volume_formula_177(D, H):
         V (float): The calculated stem volume in dm3.
     """
     # Define parameters
-    a = -1.2605
     b = 1.9322
     c = -0.0897
     d = 2.1795
     e = -1.1676
 
-    # Implement formula
-    V = 10**a * D**b * (D + 20) ** c * H**d * (H + 1.3) ** e
+    # Calculate volume in log space, replacing the five powers by a single exp
+    V = exp(_LN_K177 + b * ln(D) + c * ln(D + 20) + d * ln(H) + e * ln(H + 1.3))
     return V
 
 
@@ -4413,7 +4652,8 @@ def stem_volume_formula_178(D, H):
     b = 1.13323
     c = 0.1306
     # Implement formula
-    V = (pi / 4) * (a * D**2 * H + b * D**2 + c * D)
+    D2 = D * D
+    V = _PI4 * (a * D2 * H + b * D2 + c * D)
     return V
 
 
@@ -4434,7 +4674,9 @@ def stem_volume_formula_179(D, H):
     b = 1.895629295
     c = 0.001650837
     d = 0.8392146
-    V = a * D * (b + c) * (H**d)
+
+    # D is raised to b + c as in formulas 180 and 181
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -4456,7 +4698,7 @@ def stem_volume_formula_180(D, H):
     c = -0.00773694
     d = 0.8392146
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -4481,7 +4723,7 @@ def stem_volume_formula_181(D, H):
     c = -0.00773694
     d = 0.8392146
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -4511,7 +4753,12 @@ def stem_volume_formula_182(D: float, H: float) -> float:
     e = 0.4099
 
     # Calculate volume
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -4533,8 +4780,11 @@ def stem_volume_formula_183(D, H):
     c = 0.1089
     d = -0.1963
     e = 0.5681
-    V = a * 10 ** (
-        b * log(D) + c * (log(D) ** 2) + d * log(H) + e * (log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
     )
     return V
 
@@ -4560,7 +4810,7 @@ def stem_volume_formula_184(D, H):
     b = 0.0000435
     c = 0.89
 
-    V = a + b * D**2 * H**c
+    V = a + b * D * D * H**c
     return V
 
 
@@ -4583,7 +4833,7 @@ def stem_volume_formula_185(D, H):
     a = 9.69
     b = 0.0365
 
-    V = a + b * (D**2) * H
+    V = a + b * (D * D) * H
     return V
 
 
@@ -4602,7 +4852,7 @@ def stem_volume_formula_186(D, H):
     """
     a = -0.21
     b = 0.0398
-    V = a + b * D**2 * H
+    V = a + b * D * D * H
     return V
 
 
@@ -4629,7 +4879,12 @@ def stem_volume_formula_187(D, H):
     e = 0.0654
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
 
     # Return the calculated volume
     return V
@@ -4653,7 +4908,9 @@ def stem_volume_formula_188(D, H):
     c = -4.7e-05
     d = -0.01333
     e = 0.004859
-    V = a * D**2 + b * D**2 * H + c * D**2 * H**2 + d * D * H + e * D * H**2
+    # Horner form of a * D**2 + b * D**2 * H + c * D**2 * H**2 + d * D * H
+    # + e * D * H**2
+    V = D * D * (a + H * (b + c * H)) + D * H * (d + e * H)
     return V
 
 
@@ -4673,7 +4930,7 @@ def stem_volume_formula_189(D, H):
     a = 0.03597
     b = 1.84297
     c = 1.15988
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -4695,7 +4952,9 @@ def stem_volume_formula_190(D, H):
     c = -5e-06
     d = 0.01704
     e = 0.002926
-    V = a * D**2 * H + b * D**2 * H + c * D**2 * H**2 + d * D * H + e * D * H**2
+    # Horner form of a * D**2 * H + b * D**2 * H + c * D**2 * H**2 + d * D * H
+    # + e * D * H**2, whose first two terms share the monomial D**2 * H
+    V = D * H * (D * (a + b + c * H) + d + e * H)
     return V
 
 
@@ -4724,7 +4983,7 @@ def stem_volume_formula_191(D, H):
     a = 0.0732
     b = 1.6933
     c = 1.0562
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -4751,7 +5010,8 @@ def stem_volume_formula_192(D, H):
     e = 3.3282e-4
     f = 3.1526e-5
 
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -4780,10 +5040,15 @@ def stem_volume_formula_193(D, H):
     f = 3.9371 * 10 ** (-5)
 
     # Implement formula
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
+# exp(c) with c = -2.43151 of formula 194
+_EXP_C194 = exp(-2.43151)
+
+
 def stem_volume_formula_194(D, H):
     """Calculate the stem volume for a standing tree.
 
@@ -4802,9 +5067,8 @@ def stem_volume_formula_194(D, H):
     # Define the parameters
     a = 1.90053
     b = 0.80726
-    c = -2.43151
     # Implement formula
-    V = (D**a) * (H**b) * exp(c)
+    V = _power_form(D, H, _EXP_C194, a, b)
     return V
 
 
@@ -4826,7 +5090,8 @@ def stem_volume_formula_195(D, H):
     c = 2.1342
     d = -2.6902
     e = -1.4265
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -4849,7 +5114,12 @@ def stem_volume_formula_196(D, H):
     d = 1.1411
     e = -0.1047
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -4874,7 +5144,7 @@ def stem_volume_formula_197(D, H):
     c = 0.000297255
     d = 0.48824344
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -4903,7 +5173,7 @@ def stem_volume_formula_198(D: float, H: float) -> float:
     d = 0.48824344
 
     # Calculate volume
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
 
     return V
 
@@ -4926,7 +5196,7 @@ def stem_volume_formula_199(D, H):
     c = 0
     d = 0.48824344
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -4952,7 +5222,12 @@ def stem_volume_formula_200(D, H):
     d = 1.4084
     e = 0.0409
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -4975,7 +5250,7 @@ def stem_volume_formula_201(D, H):
     a = 1.1909
     b = 0.038639
 
-    V = a + b * (D**2) * H
+    V = a + b * (D * D) * H
     return V
 
 
@@ -4995,7 +5270,7 @@ def stem_volume_formula_202(D, H):
     a = 9.6e-05
     b = 1.821
     c = 0.759
-    V = a * D**b * H**c
+    V = _power_form(D, H, a, b, c)
     return V
 
 
@@ -5022,7 +5297,12 @@ def stem_volume_formula_203(D, H):
     e = 0.4811
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
 
     # Return the calculated volume
     return V
@@ -5090,10 +5370,19 @@ def stem_volume_formula_206(D, H):
     c = 0.3108
     d = 0.5356
     e = 0.2139
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
+# exp(c) with c = -2.86353 of formula 207
+_EXP_C207 = exp(-2.86353)
+
+
 def stem_volume_formula_207(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -5110,8 +5399,7 @@ def stem_volume_formula_207(D, H):
     """
     a = 2.00333
     b = 0.85925
-    c = -2.86353
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C207, a, b)
     return V
 
 
@@ -5138,10 +5426,15 @@ def stem_volume_formula_208(D, H):
     e = -0.000743
     f = 3.7473e-5
 
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
+# exp(c) with c = -2.71877 of formula 209
+_EXP_C209 = exp(-2.71877)
+
+
 def stem_volume_formula_209(D, H):
     """Calculate the stem volume for a standing tree of Quercus rubra (Red oak, chêne rouge) in the Netherlands.
 
@@ -5162,10 +5455,9 @@ def stem_volume_formula_209(D, H):
     # Define parameters
     a = 1.83932
     b = 0.9724
-    c = -2.71877
 
     # Implement formula
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C209, a, b)
     return V
 
 
@@ -5191,7 +5483,7 @@ def stem_volume_formula_210(D, H):
     d = -0.930406
     e = -215.758
     f = 168.477
-    V = (pi / 4) * (a * D**2 * H + b * D**2 + c * D * H + d * H + e * D + f)
+    V = _PI4 * (a * D * D * H + b * D * D + c * D * H + d * H + e * D + f)
 
     return V
 
@@ -5212,7 +5504,7 @@ def stem_volume_formula_211(D, H):
     a = 0.417118
     b = 0.21941
     c = 13.32594
-    V = (pi / 4) * (a * D**2 * H + b * D**2 * H * (ln(D) ** 2) + c * D**2)
+    V = _PI4 * (a * D * D * H + b * D * D * H * (ln(D) ** 2) + c * D * D)
     return V
 
 
@@ -5236,7 +5528,8 @@ def stem_volume_formula_212(D, H):
     e = -0.0016657
     f = 0.000036985
 
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
@@ -5261,7 +5554,7 @@ def stem_volume_formula_213(D, H):
     c = 0.001965013
     d = 0.56366437
 
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -5290,7 +5583,7 @@ def stem_volume_formula_214(D: float, H: float) -> float:
     d = 0.56366437
 
     # Calculate volume
-    V = a * D ** (b + c) * H**d
+    V = _power_form(D, H, a, b + c, d)
 
     return V
 
@@ -5312,7 +5605,9 @@ def stem_volume_formula_215(D, H):
     b = 2.040672356
     c = -0.04354461
     d = 0.56366437
-    V = a * D * (b + c) * (H**d)
+
+    # D is raised to b + c as in formulas 213 and 214
+    V = _power_form(D, H, a, b + c, d)
     return V
 
 
@@ -5338,7 +5633,12 @@ def stem_volume_formula_216(D, H):
     d = 0.8059
     e = -0.0045
 
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -5363,7 +5663,7 @@ def stem_volume_formula_217(D, H):
     c = 0.75
 
     # equation
-    V = a + b * (D**2) * (H**c)
+    V = a + b * (D * D) * (H**c)
 
     return V
 
@@ -5386,7 +5686,7 @@ def stem_volume_formula_218(D, H):
     c = 0.01283
     d = 0.0138
     e = -0.06311
-    V = a + b * D**2 + c * D**2 * H + d * D * H**2 + e * H**2
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
@@ -5413,7 +5713,12 @@ def stem_volume_formula_219(D, H):
     e = 0.0269
 
     # Calculate the volume according to the formula given by Zianis et al.
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
 
     # Return the calculated volume
     return V
@@ -5437,7 +5742,12 @@ def stem_volume_formula_220(D, H):
     c = -0.1296
     d = 0.6843
     e = 0.2745
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
@@ -5459,10 +5769,13 @@ def stem_volume_formula_221(D, H):
     c = 0.0302
     d = 0.8572
     e = 0.1791
-    V = (
-        a
-        * 10
-        * (b * log(D) + c * (log(D) ** 2) + d * log(H) + e * (log(H) ** 2))
+    # a * 10**(b * log(D) + c * log(D)**2 + d * log(H) + e * log(H)**2) as in
+    # the other formulas of Giurgiu (1974), with log(x) = ln(x) / ln(10) and
+    # 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
     )
     return V
 
@@ -5485,10 +5798,15 @@ def stem_volume_formula_222(D, H):
     c = 0.01283
     d = 0.0138
     e = -0.06311
-    V = a + b * D**2 + c * D**2 * H + d * H**2 + D + e * H**2
+    # d * D * H**2 as in formula 218
+    V = a + b * D * D + c * D * D * H + d * D * H * H + e * H * H
     return V
 
 
+# exp(c) with c = -2.64821 of formula 223
+_EXP_C223 = exp(-2.64821)
+
+
 def stem_volume_formula_223(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -5504,8 +5822,7 @@ def stem_volume_formula_223(D, H):
     """
     a = 1.67887
     b = 1.11243
-    c = -2.64821
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C223, a, b)
     return V
 
 
@@ -5530,7 +5847,8 @@ def stem_volume_formula_224(D, H):
     d = -2.3337
     e = -1.3024
 
-    V = a * H**b * D**c * (H - 1.3) ** d * (D + 40) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 40))
     return V
 
 
@@ -5557,10 +5875,19 @@ def stem_volume_formula_225(D, H):
     e = -0.1903
 
     # Implement formula
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
     return V
 
 
+# exp(c) with c = -3.54922 of formula 226
+_EXP_C226 = exp(-3.54922)
+
+
 def stem_volume_formula_226(D, H):
     """Calculate the stem volume for a standing tree.
 
@@ -5579,9 +5906,8 @@ def stem_volume_formula_226(D, H):
     # Define parameters
     a = 1.76755
     b = 1.37219
-    c = -3.54922
-    # Implement formula
-    V = (D**a) * (H**b) * exp(c)  # QTsuga heterophylla (Hemlock)(Neatherlands)
+    # Implement formula - QTsuga heterophylla (Hemlock)(Neatherlands)
+    V = _power_form(D, H, _EXP_C226, a, b)
     return V
 
 
@@ -5603,7 +5929,8 @@ def stem_volume_formula_227(D, H):
     c = 1.9145
     d = -1.2696
     e = -0.6715
-    V = a * (H**b) * (D**c) * (H - 1.3) ** d * (D + 100) ** e
+    # Calculate volume in log space, replacing the four powers by a single exp
+    V = a * exp(b * ln(H) + c * ln(D) + d * ln(H - 1.3) + e * ln(D + 100))
     return V
 
 
@@ -5627,10 +5954,15 @@ def stem_volume_formula_228(D, H):
     e = 0.00016516
     f = 0.000038311
 
-    V = a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    # Horner form of a + b * D + c * D**2 + d * D**3 + e * H + f * D**2 * H
+    V = a + D * (b + D * (c + d * D)) + H * (e + f * D * D)
     return V
 
 
+# exp(c) with c = -4.20064 of formula 229
+_EXP_C229 = exp(-4.20064)
+
+
 def stem_volume_formula_229(D, H):
     """Calculates the volume of the stem of a standing tree.
 
@@ -5649,9 +5981,8 @@ def stem_volume_formula_229(D, H):
     """
     a = 1.94295
     b = 1.29229
-    c = -4.20064
 
-    V = D**a * H**b * exp(c)
+    V = _power_form(D, H, _EXP_C229, a, b)
     return V
 
 
@@ -5681,6 +6012,19 @@ def stem_volume_formula_230(D: float, H: float) -> float:
     e = -0.0708
 
     # Calculate volume
-    V = a * 10 ** (b * log(D) + c * log(D) ** 2 + d * log(H) + e * log(H) ** 2)
+    # log(x) = ln(x) / ln(10) and 10**x = exp(x * ln(10))
+    ln_D = ln(D)
+    ln_H = ln(H)
+    V = a * exp(
+        b * ln_D + c / _LN10 * ln_D * ln_D + d * ln_H + e / _LN10 * ln_H * ln_H
+    )
 
     return V
+
+
+# Lookup table of all formulas: stem_volume_formula_<i> is at index i - 1. It
+# lets callers dispatch on the formula number without a getattr per call.
+FORMULAS = tuple(
+    globals()[f'stem_volume_formula_{formula_no}']
+    for formula_no in range(1, 231)
+)
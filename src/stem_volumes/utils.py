@@ -1,85 +1,162 @@
 """Utility functions."""
 
-import argparse
 import functools  # Added for caching
-import importlib.util
 import inspect
-import os
 import re
-from math import exp
+import textwrap
 
-import docstring_parser
 import numpy as np
 import pandas as pd
 
 from stem_volumes.genus_dict import genus_species_common_dict
 
+# A section of a Google style docstring, i.e., a header like 'Args:' followed
+# by indented lines
+_SECTION_RE = re.compile(r'^(\w+):[ \t]*\n((?:[ \t]+\S.*\n?|[ \t]*\n)+)', re.M)
+
+# The 'name (type):' prefix of an entry of a docstring section
+_ENTRY_PREFIX_RE = re.compile(r'\w+(?: ?\([^)]*\))?:\s*')
+
+# The last word of the first sentence of a description, i.e., the first word
+# followed by a period, or the last word if there is no period
+_UNIT_RE = re.compile(r'([^\s.]+)[^\S.]*(?:\.|$)')
+
+# The 'Species:' line of a formula docstring
+_SPECIES_RE = re.compile(r'Species\s*:? ?([^\n]+)')
+
 
-# --- Changed: cache parsed docstrings to avoid repeated parsing for the same function ---
 @functools.lru_cache(maxsize=None)
 def parse_docstring_cached(f):
-    """Parses the docstring of the given function and caches the result."""
-    return docstring_parser.parse(f.__doc__)
+    """Parses the sections of the docstring of the given function.
+
+    This only understands the subset of the Google docstring style used by the
+    stem volume formulas, which is much faster than a full docstring parser.
+
+    Returns:
+        A dict mapping the section names, e.g., 'Args' and 'Returns', to the
+        descriptions of the entries of the section.
+    """
+    docstring = inspect.cleandoc(f.__doc__)
+    sections = {}
+    for match in _SECTION_RE.finditer(docstring):
+        # Entries start at the indentation of the section, more indented lines
+        # continue the previous entry
+        entries = re.split(r'\n(?=\S)', textwrap.dedent(match.group(2)).strip())
+        sections[match.group(1)] = [
+            entry[len(prefix.group(0)) :]
+            if (prefix := _ENTRY_PREFIX_RE.match(entry))
+            else entry
+            for entry in entries
+        ]
+    return sections
+
+
+def _unit(description):
+    """Returns the last word of the first sentence of the given description."""
+    return _UNIT_RE.search(description).group(1)
 
 
+@functools.lru_cache(maxsize=None)
 def extract_parameter_units(f):
-    """Extracts the parameter units from the docstring of the given stem volume formula."""
+    """Extracts the parameter units from the docstring of the given stem volume formula.
+
+    The units are cached per formula and returned as a tuple, so that the
+    cached result cannot be modified by the caller.
+    """
     # Use cached docstring parse
-    parsed_docstring = parse_docstring_cached(f)
-    return [
-        p.description.split('.')[0].split()[-1] for p in parsed_docstring.params
-    ]
+    return tuple(_unit(d) for d in parse_docstring_cached(f)['Args'])
 
 
+@functools.lru_cache(maxsize=None)
 def extract_volume_unit(f):
     """Extracts the volume unit from the docstring of the given stem volume formula."""
     # Use cached docstring parse
-    parsed_docstring = parse_docstring_cached(f)
-    return parsed_docstring.returns.description.split('.')[0].split()[-1]
+    return _unit(parse_docstring_cached(f)['Returns'][0])
+
+
+# Converters of volumes in the given unit to m3, looked up with a single dict
+# access. They accept scalars and NumPy arrays and do not modify their input.
+_TO_M3 = {
+    'm3': lambda value: value,
+    'dm3': lambda value: value / 1000,
+    'ln(m3)': np.exp,
+    'ln(dm3)': lambda value: np.exp(value) / 1000,
+}
 
 
 def convert_volume_to_m3(value, value_unit):
-    """Converts the given value with given value unit to m3."""
-    assert value_unit in set(['dm3', 'm3', 'ln(dm3)', 'ln(m3)'])
+    """Converts the given value with given value unit to m3.
+
+    Raises:
+        KeyError: If the value unit is not a known volume unit.
+    """
+    return _TO_M3[value_unit](value)
 
-    if value_unit.startswith('ln('):
-        value = np.exp(value)
-        value_unit = value_unit[3:-1]
 
-    if value_unit == 'dm3':
-        value /= 1000
+def get_conversion_factor(from_unit: str, to_unit: str) -> float:
+    """Returns the conversion factor to convert a measurement from one unit to another.
 
-    return value
+    Args:
+        from_unit: The unit of the original measurement ('mm', 'cm', 'dm', 'm').
+        to_unit: The unit to convert the measurement to ('mm', 'cm', 'dm', 'm').
+
+    Returns:
+        The conversion factor to apply to the original measurement.
+    """
+    unit_conversion_factors = {'mm': 0.001, 'cm': 0.01, 'dm': 0.1, 'm': 1}
+    return unit_conversion_factors[from_unit] / unit_conversion_factors[to_unit]
 
 
 def clean_data(raw_df: pd.DataFrame):
-    """Load and clean the dataset."""
-    df_filtered = raw_df.copy()
-    df_filtered.drop_duplicates(inplace=True)
-    df_filtered['species'] = df_filtered['species'].str.capitalize()
+    """Load and clean the dataset.
 
-    return df_filtered
+    Returns a new DataFrame with capitalized species and without duplicate
+    rows. The species are capitalized first, so that rows differing only in
+    the case of the species are duplicates as well.
+    """
+    df_filtered = raw_df.assign(species=raw_df['species'].str.capitalize())
+    return df_filtered.drop_duplicates()
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_species_from_docstring(docstring: str) -> str:
     """Extracts the species name from a docstring by searching for the 'Species:' line.
 
-    Returns the species string or an empty string if not found.
+    Returns the species string or an empty string if not found. The result is
+    cached per docstring.
     """
-    if not docstring:
+    # Skip the regex for docstrings without a 'Species' line
+    if not docstring or 'Species' not in docstring:
         return ''
-    match = re.search(r'Species\s*:? ?([^\n]+)', docstring)
+    match = _SPECIES_RE.search(docstring)
     return match.group(1).strip() if match else ''
 
 
 def get_genus_row_map(genus_series):
     """Returns a dict mapping genus to list of row indices in the DataFrame."""
-    genus_to_indices = {}
-    for idx, genus in genus_series.items():
-        if pd.isna(genus):
-            continue
-        genus_to_indices.setdefault(genus, []).append(idx)
-    return genus_to_indices
+    # Sort the rows by genus once, so that the rows of each genus form a
+    # contiguous slice of the sort order. Missing genera get the code -1.
+    codes, genera = pd.factorize(genus_series)
+    valid = codes >= 0
+    order = np.argsort(codes[valid], kind='stable')
+    indices = genus_series.index.to_numpy()[valid][order]
+    counts = np.bincount(codes[valid], minlength=len(genera))
+    return {
+        genus: rows.tolist()
+        for genus, rows in zip(
+            genera, np.split(indices, np.cumsum(counts)[:-1])
+        )
+    }
+
+
+# Lowercase common species names to their genus, built once at import. A name
+# listed under several genera belongs to the first of them, which is why the
+# genera are inserted in reverse order.
+_SPECIES_TO_GENUS = {
+    name.lower(): genus
+    for genus, data in reversed(genus_species_common_dict.items())
+    for name in data['species']
+}
 
 
 def match_species_names(df: pd.DataFrame) -> list:
@@ -88,22 +165,12 @@ def match_species_names(df: pd.DataFrame) -> list:
     Returns:
     - list: A list of tuples (genus, species) for each row. If no match, (None, None).
     """
-    matched = []
-    lowercase_species_dict = {
-        genus: {s.lower() for s in data['species']}
-        for genus, data in genus_species_common_dict.items()
-    }
-
-    for name in df['species']:
-        lname = name.lower()
-        match = next(
-            (
-                (genus, name)
-                for genus, species_set in lowercase_species_dict.items()
-                if lname in species_set
-            ),
-            None,
-        )
-        matched.append(match if match else (None, None))
-
-    return matched
+    # Look up the genus of each distinct species only and broadcast it to the
+    # rows. Rows without a species get the code -1 and thus the last genus.
+    codes, species_names = pd.factorize(df['species'])
+    genera = [_SPECIES_TO_GENUS.get(name.lower()) for name in species_names]
+    genera = np.array(genera + [None], dtype=object)[codes]
+    return [
+        (genus, name) if genus is not None else (None, None)
+        for genus, name in zip(genera, df['species'])
+    ]
@@ -0,0 +1,283 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stem_volumes import batch
+from stem_volumes.batch import (
+    FORMULA_SPECS,
+    NUM_FORMULAS,
+    TreeBatch,
+    evaluate_all,
+    evaluate_all_f32,
+    evaluate_all_gpu,
+    evaluate_batch,
+    evaluate_formula,
+    evaluate_formula_cached,
+    evaluate_table,
+)
+from stem_volumes.utils import convert_volume_to_m3
+
+# diameters in mm and heights in dm of a few realistic trees
+DIAMETERS = np.array([80.0, 153.0, 200.0, 317.0, 452.0, 1001.0])
+HEIGHTS = np.array([65.0, 148.0, 200.0, 231.0, 290.0, 380.0])
+
+# the family kernels and their formula numbers, so that every kernel of
+# FORMULA_FAMILIES is tested
+FAMILY_KERNELS = [
+    pytest.param(kernel, formula_nos, id=kernel.__name__)
+    for formula_nos, kernel in batch.FORMULA_FAMILIES
+]
+
+
+def test_evaluate_all_shape():
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    assert volumes.shape == (len(DIAMETERS), NUM_FORMULAS)
+    assert volumes.dtype == np.float64
+
+
+@pytest.fixture(scope='module')
+def all_volumes():
+    """The volumes of all formulas for DIAMETERS and HEIGHTS, evaluated once"""
+    return evaluate_all(DIAMETERS, HEIGHTS)
+
+
+@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
+def test_evaluate_all_matches_single_calls(formula_no, all_volumes):
+    volumes = all_volumes
+    func, d_factor, h_factor, vol_unit = FORMULA_SPECS[formula_no - 1]
+    for i, (d, h) in enumerate(zip(DIAMETERS, HEIGHTS)):
+        args = []
+        if d_factor is not None:
+            args.append(d * d_factor)
+        if h_factor is not None:
+            args.append(h * h_factor)
+        expected = convert_volume_to_m3(func(*args), vol_unit)
+        assert volumes[i, formula_no - 1] == pytest.approx(
+            expected, rel=1e-12, nan_ok=True
+        )
+
+
+def test_evaluate_all_writes_into_out():
+    out = np.zeros((len(DIAMETERS), NUM_FORMULAS))
+    volumes = evaluate_all(DIAMETERS, HEIGHTS, out=out)
+    assert volumes is out
+    assert np.isfinite(out).any()
+
+
+def test_evaluate_all_masks_non_positive_inputs():
+    D = np.array([0.0, 200.0, -5.0, 200.0])
+    H = np.array([200.0, 0.0, 200.0, 200.0])
+    volumes = evaluate_all(D, H)
+    for k, (_, d_factor, h_factor, _) in enumerate(FORMULA_SPECS):
+        assert np.isnan(volumes[0, k]) == (d_factor is not None)
+        assert np.isnan(volumes[1, k]) == (h_factor is not None)
+        assert np.isnan(volumes[2, k]) == (d_factor is not None)
+    assert np.isfinite(volumes[3]).any()
+
+
+def test_tree_batch_from_dataframe():
+    df = pd.DataFrame(
+        {
+            'species': ['Picea abies', 'Fagus sylvatica', None, 'picea abies'],
+            'diameter at breast height [mm]': [200, 317.0, 80.0, 452.0],
+            'height [dm]': [200.0, 231.0, 65.0, 290.0],
+        }
+    )
+    batch = TreeBatch.from_dataframe(df)
+    assert len(batch) == 4
+    np.testing.assert_array_equal(batch.D, [200.0, 317.0, 80.0, 452.0])
+    np.testing.assert_array_equal(batch.H, [200.0, 231.0, 65.0, 290.0])
+    assert batch.D.flags.c_contiguous and batch.H.flags.c_contiguous
+    assert np.shares_memory(batch.D, batch.H.base)
+    assert list(batch.species_names[batch.species]) == [
+        'picea abies',
+        'fagus sylvatica',
+        '',
+        'picea abies',
+    ]
+
+
+def test_evaluate_all_f32_matches_evaluate_all():
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    volumes_f32 = evaluate_all_f32(DIAMETERS, HEIGHTS)
+    assert volumes_f32.dtype == np.float32
+    np.testing.assert_allclose(volumes_f32, volumes, rtol=1e-3, atol=1e-9)
+
+
+def test_evaluate_all_f32_error_on_realistic_trees():
+    D, H = np.meshgrid(np.linspace(50, 800, 60), np.linspace(20, 400, 60))
+    D = D.ravel()
+    H = H.ravel()
+    volumes = evaluate_all(D, H)
+    volumes_f32 = evaluate_all_f32(D, H)
+    np.testing.assert_allclose(volumes_f32, volumes, rtol=1e-3, atol=1e-5)
+
+
+def test_evaluate_all_blocks(monkeypatch):
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    monkeypatch.setattr(batch, 'BLOCK_SIZE', 4)
+    np.testing.assert_array_equal(evaluate_all(DIAMETERS, HEIGHTS), volumes)
+
+
+def test_evaluate_all_gpu_matches_evaluate_all():
+    cupy = pytest.importorskip('cupy')
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    volumes_gpu = evaluate_all_gpu(
+        cupy.asarray(DIAMETERS), cupy.asarray(HEIGHTS)
+    )
+    np.testing.assert_allclose(cupy.asnumpy(volumes_gpu), volumes, rtol=1e-12)
+
+
+@pytest.mark.parametrize('formula_no', [1, 4, 89, 107, 139, 148, 230])
+def test_evaluate_formula_matches_evaluate_all(formula_no):
+    D = np.append(DIAMETERS, 0.0)
+    H = np.append(HEIGHTS, 200.0)
+    # the formulas of FORMULA_FAMILIES are evaluated by their family kernels
+    np.testing.assert_allclose(
+        evaluate_formula(formula_no, D, H),
+        evaluate_all(D, H)[:, formula_no - 1],
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize('formula_no', [0, -1, NUM_FORMULAS + 1])
+def test_unknown_formula_numbers_raise(formula_no):
+    df = pd.DataFrame(
+        {
+            'species': ['Picea abies'],
+            'diameter at breast height [mm]': [300.0],
+            'height [dm]': [200.0],
+        }
+    )
+    with pytest.raises(ValueError):
+        evaluate_formula(formula_no, DIAMETERS, HEIGHTS)
+    with pytest.raises(ValueError):
+        evaluate_batch([1, formula_no], DIAMETERS[:2], HEIGHTS[:2])
+    with pytest.raises(ValueError):
+        evaluate_table(df, [1, formula_no])
+
+
+@pytest.mark.parametrize('kernel, formula_nos', FAMILY_KERNELS)
+def test_family_kernel_matches_formulas(kernel, formula_nos):
+    volumes = kernel(DIAMETERS, HEIGHTS)
+    assert volumes.shape == (len(DIAMETERS), len(formula_nos))
+    for k, formula_no in enumerate(formula_nos):
+        np.testing.assert_allclose(
+            volumes[:, k],
+            evaluate_formula(formula_no, DIAMETERS, HEIGHTS),
+            rtol=1e-12,
+        )
+
+
+def test_evaluate_batch_matches_evaluate_formula():
+    formula_nos = np.array([107, 1, 230, 107, 89, 1])
+    volumes = evaluate_batch(formula_nos, DIAMETERS, HEIGHTS)
+    for i, formula_no in enumerate(formula_nos):
+        expected = evaluate_formula(formula_no, DIAMETERS[i], HEIGHTS[i])
+        assert volumes[i] == pytest.approx(expected, rel=1e-12)
+
+
+def test_evaluate_all_deduplicates_trees():
+    D = np.tile(DIAMETERS, 3)
+    H = np.tile(HEIGHTS, 3)
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    np.testing.assert_array_equal(evaluate_all(D, H), np.tile(volumes, (3, 1)))
+
+
+@pytest.mark.parametrize('missing', ['D', 'H'])
+def test_evaluate_all_keeps_trees_with_nan_apart(missing):
+    # formulas 4, 23, 27 and 85 only use D and formula 139 only uses H
+    formula_nos = [4, 23, 27, 85, 139]
+    # with NaN in all trees, and in few enough trees for deduplication
+    for nan_rows in (slice(None), slice(2)):
+        D = np.tile(DIAMETERS, 4)
+        H = np.tile(HEIGHTS, 4)
+        (D if missing == 'D' else H)[nan_rows] = np.nan
+        volumes = evaluate_all(D, H)
+        for formula_no in formula_nos:
+            np.testing.assert_allclose(
+                volumes[:, formula_no - 1],
+                evaluate_formula(formula_no, D, H),
+                rtol=1e-12,
+            )
+
+
+def test_evaluate_all_uses_family_kernels(monkeypatch):
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    monkeypatch.setattr(batch, 'FORMULA_FAMILIES', ())
+    np.testing.assert_allclose(
+        evaluate_all(DIAMETERS, HEIGHTS), volumes, rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize('kernel, formula_nos', FAMILY_KERNELS)
+def test_family_kernel_on_gpu(kernel, formula_nos):
+    cupy = pytest.importorskip('cupy')
+    volumes = kernel(cupy.asarray(DIAMETERS), cupy.asarray(HEIGHTS))
+    assert isinstance(volumes, cupy.ndarray)
+    np.testing.assert_allclose(
+        cupy.asnumpy(volumes), kernel(DIAMETERS, HEIGHTS), rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize('kernel, formula_nos', FAMILY_KERNELS)
+def test_family_kernel_in_float32(kernel, formula_nos):
+    volumes = kernel(DIAMETERS.astype(np.float32), HEIGHTS.astype(np.float32))
+    assert volumes.dtype == np.float32
+    np.testing.assert_allclose(volumes, kernel(DIAMETERS, HEIGHTS), rtol=1e-4)
+
+
+def test_evaluate_all_in_parallel(monkeypatch):
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    monkeypatch.setattr(batch, 'BLOCK_SIZE', 2)
+    np.testing.assert_array_equal(
+        evaluate_all(DIAMETERS, HEIGHTS, workers=3), volumes
+    )
+
+
+def test_evaluate_table_matches_evaluate_all():
+    df = pd.DataFrame(
+        {
+            'species': ['Picea abies'] * len(DIAMETERS),
+            'diameter at breast height [mm]': DIAMETERS,
+            'height [dm]': HEIGHTS,
+        },
+        index=range(10, 10 + len(DIAMETERS)),
+    )
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    table = evaluate_table(df, [107, 1, 230])
+    assert list(table.columns) == [
+        'stem_volume_formula_107 [m3]',
+        'stem_volume_formula_1 [m3]',
+        'stem_volume_formula_230 [m3]',
+    ]
+    assert table.index.equals(df.index)
+    np.testing.assert_allclose(
+        table.to_numpy(), volumes[:, [106, 0, 229]], rtol=1e-12
+    )
+    np.testing.assert_array_equal(evaluate_table(df).to_numpy(), volumes)
+    # any iterable of formula numbers is accepted
+    table = evaluate_table(df, (no for no in [107, 1, 230]))
+    np.testing.assert_allclose(
+        table.to_numpy(), volumes[:, [106, 0, 229]], rtol=1e-12
+    )
+    # the species are not needed
+    np.testing.assert_array_equal(
+        evaluate_table(df.drop(columns='species')).to_numpy(), volumes
+    )
+
+
+def test_evaluate_formula_cached_matches_evaluate_formula():
+    for formula_no in (1, 89, 107, 230):
+        for d, h in zip(DIAMETERS, HEIGHTS):
+            expected = evaluate_formula(formula_no, d, h)
+            assert evaluate_formula_cached(formula_no, d, h) == expected
+            assert evaluate_formula_cached(formula_no, d, h) == expected
+    assert np.isnan(evaluate_formula_cached(1, 0.0, 200.0))
+
+
+def test_evaluate_all_families_in_parallel():
+    volumes = evaluate_all(DIAMETERS, HEIGHTS)
+    np.testing.assert_array_equal(
+        evaluate_all(DIAMETERS, HEIGHTS, workers=3), volumes
+    )
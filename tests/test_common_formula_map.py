@@ -1,3 +1,14 @@
+# Common names to fully exclude (mapping + formula checks)
+FULL_EXCLUSIONS = frozenset(
+    {
+        'chestnut',
+        'european crab apple',
+        'european wild pear',
+        'european yew',
+    }
+)
+
+
 def test_all_species_and_formulas_mapped():
     from collections import defaultdict
 
@@ -5,27 +16,24 @@ def test_all_species_and_formulas_mapped():
     from stem_volumes.genus_formula_map import genus_to_formulas
     from stem_volumes.species_to_formula_map import species_to_formulas
 
-    # Common names to fully exclude (mapping + formula checks)
-    full_exclusions = {
-        'chestnut',
-        'european crab apple',
-        'european wild pear',
-        'european yew',
-    }
-
-    # 1. Collect all expected common names (excluding full exclusions)
-    expected_species = set()
-    for genus_info in genus_species_common_dict.values():
+    # 1. Collect all expected common names (excluding full exclusions) and
+    # their expected formula sets (accumulating across all genera) in a single
+    # walk over the genera
+    expected_formula_map = defaultdict(set)
+    for genus, genus_info in genus_species_common_dict.items():
+        # The formulas of a genus are hashed once for all of its species
+        formulas = frozenset(genus_to_formulas.get(genus, ()))
         for name in genus_info.get('species', []):
             name = name.strip().lower()
-            if name and name not in full_exclusions:
-                expected_species.add(name)
+            if name and name not in FULL_EXCLUSIONS:
+                expected_formula_map[name].update(formulas)
+    expected_species = set(expected_formula_map)
 
     # 2. Collect all mapped species names (excluding full exclusions)
     mapped_species = {
         name
         for name in species_to_formulas.keys()
-        if name not in full_exclusions
+        if name not in FULL_EXCLUSIONS
     }
 
     # 3. Check for missing and extra species names
@@ -39,16 +47,7 @@ def test_all_species_and_formulas_mapped():
         f'Unexpected species names in mapping: {sorted(extra_names)}'
     )
 
-    # 4. Build expected formula sets per species name (accumulating across all genera)
-    expected_formula_map = defaultdict(set)
-    for genus, genus_info in genus_species_common_dict.items():
-        formulas = genus_to_formulas.get(genus, [])
-        for name in genus_info.get('species', []):
-            name = name.strip().lower()
-            if name and name not in full_exclusions:
-                expected_formula_map[name].update(formulas)
-
-    # 5. Compare expected formulas with actual formulas
+    # 4. Compare expected formulas with actual formulas
     for name in expected_formula_map:
         expected = expected_formula_map[name]
         actual = set(species_to_formulas.get(name, []))
@@ -1,57 +1,79 @@
 import argparse
+import functools
 import importlib.util
 import inspect
 import os
 import re
 
+# The genus, i.e., the first word of the 'Species:' line of a docstring
+_GENUS_RE = re.compile(r'Species:\s*(\w+)')
+
 
 # Function to extract genus from the docstring
 def get_genus_from_docstring(docstring: str) -> str:
     """Extract genus from the docstring's species information."""
-    match = re.search(r'Species:\s*(\w+)', docstring)
+    # A substring test rejects docstrings without species cheaper than the regex
+    if not docstring or 'Species:' not in docstring:
+        return None
+    match = _GENUS_RE.search(docstring)
     if match:
         return match.group(1)
     return None
 
 
-def match_genus_to_functions(genus_list: list, script_path: str) -> dict:
-    """Match genus names from a list to functions with corresponding docstrings in the given Python script."""
-    function_names = []
-    genus_values = []
-
-    # Ensure the absolute path to the script is used
-    script_path = os.path.abspath(script_path)
+@functools.lru_cache(maxsize=None)
+def _load_genus_functions(script_path: str, mtime: float) -> tuple:
+    """Load the given Python script once and return (name, genus) of each function with a genus.
 
+    The modification time of the script is part of the cache key, so that a
+    changed script is loaded again.
+    """
     # Load the script as a module using importlib
     module_name = os.path.splitext(os.path.basename(script_path))[0]
 
-    try:
-        # Import the script dynamically as a module
-        spec = importlib.util.spec_from_file_location(module_name, script_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Extract functions from the dynamically loaded module
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            # Get the docstring
-            docstring = inspect.getdoc(obj)
-            if docstring:
-                genus = get_genus_from_docstring(docstring)
-                if genus:
-                    function_names.append(name)
-                    genus_values.append(genus)
+    # Import the script dynamically as a module
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Extract functions defined by the module, in the order of definition,
+    # without sorting all its members like inspect.getmembers
+    # The bound search method is hoisted out of the loop and the genus is
+    # matched inline, as in get_genus_from_docstring
+    search = _GENUS_RE.search
+    genus_functions = []
+    for name, obj in vars(module).items():
+        if not inspect.isfunction(obj) or obj.__module__ != module.__name__:
+            continue
+        # Get the raw docstring, as the regex does not depend on indentation
+        docstring = obj.__doc__
+        if docstring and 'Species:' in docstring:
+            match = search(docstring)
+            if match:
+                genus_functions.append((name, match.group(1)))
+    return tuple(genus_functions)
 
+
+def match_genus_to_functions(genus_list: list, script_path: str) -> dict:
+    """Match genus names from a list to functions with corresponding docstrings in the given Python script."""
+    try:
+        # Ensure the absolute path to the script is used, so that the cache of
+        # loaded scripts is keyed on it
+        script_path = os.path.abspath(script_path)
+        genus_functions = _load_genus_functions(
+            script_path, os.path.getmtime(script_path)
+        )
     except Exception as e:
         print(f'Error loading script: {e}')
         return {}
 
-    # Apply boolean indexing to filter functions by genus in genus_list
+    # Filter the functions by genus in genus_list, in a single pass over the
+    # functions with a hash lookup per function
+    genera = set(genus_list)
     function_dict = {}
-    for genus, name in zip(genus_values, function_names):
-        if genus in genus_list:
-            if genus not in function_dict:
-                function_dict[genus] = []
-            function_dict[genus].append(name)
+    for name, genus in genus_functions:
+        if genus in genera:
+            function_dict.setdefault(genus, []).append(name)
 
     return function_dict
 
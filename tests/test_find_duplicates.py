@@ -1,4 +1,3 @@
-import os
 import tempfile
 
 import pandas as pd
@@ -24,8 +23,9 @@ def test_find_duplicates_removes_only_duplicates(tmp_path):
     after = len(df_loaded.drop_duplicates())
     dropped = before - after
 
-    # Find actual dropped duplicates
-    dropped_rows = df_loaded[df_loaded.duplicated(keep='first')]
+    # Find actual dropped duplicates, hashing the rows once for both checks
+    dup_first = df_loaded.duplicated(keep='first')
+    dropped_rows = df_loaded[dup_first]
     # Find unique rows
     unique_rows = df_loaded[~df_loaded.duplicated(keep=False)]
 
@@ -34,15 +34,10 @@ def test_find_duplicates_removes_only_duplicates(tmp_path):
     # Assert no unique rows are in dropped_rows
     assert not any(unique_rows.index.isin(dropped_rows.index))
     # Assert only duplicates are dropped (index match)
-    expected_dropped_indices = set(
-        df_loaded.index[df_loaded.duplicated(keep='first')]
-    )
+    expected_dropped_indices = set(df_loaded.index[dup_first])
     actual_dropped_indices = set(dropped_rows.index)
     assert expected_dropped_indices == actual_dropped_indices
 
-    # Clean up (optional, handled by tmp_path)
-    os.remove(csv_path)
-
 
 def test_find_duplicates_matches_clean_data(tmp_path):
     # Create a sample DataFrame with duplicates
@@ -15,10 +15,10 @@ stem-volumes/
 from inspect import signature
 from math import exp, pi
 
+import numpy as np
 import pytest
 
 from stem_volumes import formulas
-from stem_volumes.formulas import *
 from stem_volumes.utils import (
     convert_volume_to_m3,
     extract_parameter_units,
@@ -27,1124 +27,298 @@ from stem_volumes.utils import (
 
 NUM_FORMULAS = 230
 
+# Units the docstrings may give for diameters, heights and volumes
+DIAMETER_UNITS = frozenset(['mm', 'cm', 'dm', 'm'])
+HEIGHT_UNITS = frozenset(['dm', 'm'])
+VOLUME_UNITS = frozenset(['dm3', 'm3', 'ln(dm3)', 'ln(m3)'])
+
+# Divisors to convert diameters in mm and heights in dm to the unit a formula
+# expects
+UNIT_DIVISORS = {
+    'D': {'mm': 1, 'cm': 10, 'dm': 100, 'm': 1000},
+    'H': {'dm': 1, 'm': 10},
+}
+
+
+@pytest.fixture(scope='session')
+def formula_funcs():
+    """The stem volume functions by formula number, resolved once"""
+    return {
+        formula_no: getattr(formulas, f'stem_volume_formula_{formula_no}')
+        for formula_no in range(1, NUM_FORMULAS + 1)
+    }
 
-@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_formula_function_exists(formula_no):
-    """Testing that we have a symbol named stem_volume_formula_<formula_no>"""
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    assert f
+
+@pytest.fixture(scope='session')
+def formula_units(formula_funcs):
+    """The parameter units and volume unit of the stem volume functions by
+    formula number, extracted from their docstrings once
+    """
+    return {
+        formula_no: (extract_parameter_units(f), extract_volume_unit(f))
+        for formula_no, f in formula_funcs.items()
+    }
+
+
+@pytest.fixture(scope='session')
+def formula_params(formula_funcs):
+    """The parameter names of the stem volume functions by formula number"""
+    return {
+        formula_no: list(signature(f).parameters)
+        for formula_no, f in formula_funcs.items()
+    }
+
+
+def test_formula_function_exists():
+    """Testing that we have a symbol named stem_volume_formula_<formula_no>
+    for every formula
+    """
+    missing = [
+        formula_no
+        for formula_no in range(1, NUM_FORMULAS + 1)
+        if not getattr(formulas, f'stem_volume_formula_{formula_no}', None)
+    ]
+    assert not missing, missing[:10]
+
+
+def test_formula_lookup_table():
+    """Testing that FORMULAS holds stem_volume_formula_<i> at index i - 1"""
+    assert len(formulas.FORMULAS) == NUM_FORMULAS
+    for formula_no, f in enumerate(formulas.FORMULAS, start=1):
+        assert f is getattr(formulas, f'stem_volume_formula_{formula_no}')
 
 
 @pytest.mark.xfail
 @pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_formula_function_signature(formula_no):
+def test_formula_function_signature(formula_no, formula_params):
     """Testing that the stem volume function has one or two parameters and the
     first is called `D` and the second called `H` if applicable.
 
     This makes sure that all functions follow a similar interface.
     """
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    params = list(signature(f).parameters)
+    params = formula_params[formula_no]
     assert 1 <= len(params) and len(params) <= 2
     assert params == ['D', 'H'][: len(params)], params
 
 
 @pytest.mark.xfail
 @pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_calling_formula_function(formula_no):
+def test_calling_formula_function(formula_no, formula_funcs, formula_params):
     """Testing that the stem volume function can be called"""
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    params = list(signature(f).parameters)
+    f = formula_funcs[formula_no]
+    params = formula_params[formula_no]
     args = [10.0] * len(params)
     assert f(*args) >= 0
 
 
-@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_parameter_units_from_docstring(formula_no):
-    """Testing that the stem volume function's docstring provides extractable
-    units for its parameters
+def test_parameter_units_from_docstring(formula_units):
+    """Testing that the stem volume functions' docstrings provide extractable
+    units for their parameters
     """
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    units = extract_parameter_units(f)
-    assert units[0] in set(['mm', 'cm', 'dm', 'm'])
-    if len(units) == 2:
-        assert units[1] in set(['dm', 'm'])
+    errors = [
+        (formula_no, units)
+        for formula_no, (units, _) in formula_units.items()
+        if units[0] not in DIAMETER_UNITS
+        or (len(units) == 2 and units[1] not in HEIGHT_UNITS)
+    ]
+    assert not errors, errors[:10]
 
 
-@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_volume_unit_from_docstring(formula_no):
-    """Testing that the stem volume function's docstring provides extractable
-    units for its return value
+def test_volume_unit_from_docstring(formula_units):
+    """Testing that the stem volume functions' docstrings provide extractable
+    units for their return values
     """
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    unit = extract_volume_unit(f)
-    assert unit in set(['dm3', 'm3', 'ln(dm3)', 'ln(m3)'])
+    errors = [
+        (formula_no, unit)
+        for formula_no, (_, unit) in formula_units.items()
+        if unit not in VOLUME_UNITS
+    ]
+    assert not errors, errors[:10]
 
 
-@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
-def test_formulas(formula_no):
-    """Tests that the calculated volume is not larger than the volume of a
+def test_formulas(formula_funcs, formula_params, formula_units):
+    """Tests that the calculated volumes are not larger than the volume of a
     cyclinder
     """
 
-    function_name = f'stem_volume_formula_{formula_no}'
-    f = getattr(formulas, function_name)
-    params = list(signature(f).parameters)
-    parameter_units = extract_parameter_units(f)
-
-    # convert units to what the formula expects
-    UNITS = {
-        'D': ['mm', 'cm', 'dm', 'm'],  # units for diameters
-        'H': ['dm', 'm'],  # units for heights
-    }
     diameter_mm = 200
     height_dm = 200
     args = {'D': diameter_mm, 'H': height_dm}
-    converted_args = [
-        args[par_name] / 10 ** UNITS[par_name].index(parameter_units[i])
-        for i, par_name in enumerate(params)
-    ]
 
-    # call stem volume formula and convert volume to m3
-    volume = f(*converted_args)
-    volume_unit = extract_volume_unit(f)
-    volume = convert_volume_to_m3(volume, volume_unit)
-    # calculate the volume in m3 of a cylinder as upper bound
+    # call each stem volume formula once and convert its volume to m3
+    volumes = np.empty(NUM_FORMULAS)
+    for formula_no, f in formula_funcs.items():
+        parameter_units, volume_unit = formula_units[formula_no]
+        converted_args = [
+            args[par_name] / UNIT_DIVISORS[par_name][parameter_units[i]]
+            for i, par_name in enumerate(formula_params[formula_no])
+        ]
+        volume = f(*converted_args)
+        volumes[formula_no - 1] = convert_volume_to_m3(volume, volume_unit)
+
+    # calculate the volume in m3 of a cylinder as upper bound and compare all
+    # volumes at once, which also catches NaN volumes
     volume_cylinder = height_dm / 10 * pi / 4 * (diameter_mm / 1000) ** 2
-    assert 0 < volume and volume < volume_cylinder * 1.5
-
-
-def test_stem_volume_formula_1():
-    assert stem_volume_formula_1(20, 10) > 0
-    assert stem_volume_formula_1(20, 10) < 1000000
-
-
-def test_stem_volume_formula_2():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_3():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_4():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_5():
-    assert stem_volume_formula_5(1, 1) > 0
-    assert stem_volume_formula_5(3, 100) < 1000
-
-
-def test_stem_volume_formula_6():
-    assert stem_volume_formula_6(1, 25) > 0
-    assert stem_volume_formula_6(1, 25) < 10000  # dm³
-
-
-def test_stem_volume_formula_7():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_8():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_9():
-    assert stem_volume_formula_9(20, 10) > 0
-    assert stem_volume_formula_9(20, 10) < 1000000
-
-
-def test_stem_volume_formula_10():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_11():
-    assert stem_volume_formula_11(1, 2) > 0
-    assert stem_volume_formula_11(1, 2) < 80, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_12():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_13():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_14():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_15():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_16():
-    assert stem_volume_formula_16(1, 1) > 0
-    assert stem_volume_formula_16(1, 1) < 10
-
-
-def test_stem_volume_formula_17():
-    assert stem_volume_formula_17(10, 5) > 0
-    assert stem_volume_formula_17(10, 5) < 100000
-
-
-def test_stem_volume_formula_18():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_19():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_20():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_21():
-    assert stem_volume_formula_21(1, 1) > 0
-    assert stem_volume_formula_21(30, 10) < 1
-
-
-def test_stem_volume_formula_22():
-    assert stem_volume_formula_22(1, 25) > 0
-    assert stem_volume_formula_22(1, 25) < 10000  # dm³
-
-
-def test_stem_volume_formula_23():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_24():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_25():
-    assert stem_volume_formula_25(44, 28) > 0
-    assert stem_volume_formula_25(44, 28) < 1000000
-
-
-def test_stem_volume_formula_26():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_27():
-    assert stem_volume_formula_27(2.13) > 0
-    assert stem_volume_formula_27(2.13) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_28():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_29():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_30():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_31():
-    assert stem_volume_formula_31(20, 10) > 0
-    assert stem_volume_formula_31(20, 10) < 1000
-
-
-def test_stem_volume_formula_32():
-    assert stem_volume_formula_32(1, 1) > 0
-    assert stem_volume_formula_32(1, 1) < 10
-
-
-def test_stem_volume_formula_33():
-    assert stem_volume_formula_33(5, 5) > 0
-    assert stem_volume_formula_33(5, 5) < 10000
-
-
-def test_stem_volume_formula_34():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_35():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_36():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_37():
-    assert stem_volume_formula_37(4.5, 6) > 1
-    assert stem_volume_formula_37(30, 10) < 1000
-
-
-def test_stem_volume_formula_38():
-    assert stem_volume_formula_54(10, 5) > 0
-    assert stem_volume_formula_54(10, 5) < 10000  # dm³
-
-
-def test_stem_volume_formula_39():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_40():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_41():
-    assert stem_volume_formula_41(1, 1) > 0
-    assert stem_volume_formula_41(1, 1) < 1000000
-
-
-def test_stem_volume_formula_42():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_43():
-    assert stem_volume_formula_43(1, 2) > 0
-    assert stem_volume_formula_43(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_44():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_45():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_46():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_47():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_48():
-    assert stem_volume_formula_48(30, 15) > 0
-    assert stem_volume_formula_48(30, 15) < 10
-
-
-def test_stem_volume_formula_49():
-    assert stem_volume_formula_49(20, 10) > 0
-    assert stem_volume_formula_49(20, 10) < 10
-
-
-def test_stem_volume_formula_50():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_51():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_52():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_53():
-    assert stem_volume_formula_53(1, 1) > 0
-    assert stem_volume_formula_53(30, 10) < 1000
-
-
-def test_stem_volume_formula_54():
-    assert stem_volume_formula_54(10, 2.5) > 0
-    assert stem_volume_formula_54(10, 2.5) < 10  # m³
-
-
-def test_stem_volume_formula_55():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_56():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_57():
-    assert stem_volume_formula_57(1, 1) > 0
-    assert stem_volume_formula_57(1, 1) < 1000000
-
-
-def test_stem_volume_formula_58():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_59():
-    assert stem_volume_formula_59(1, 2) > 0
-    assert stem_volume_formula_59(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_60():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_61():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_62():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_63():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_64():
-    assert stem_volume_formula_64(2.5, 25) > 25
-    assert stem_volume_formula_64(2.5, 25) < 35
-
-
-def test_stem_volume_formula_65():
-    assert stem_volume_formula_65(0.5, 1.04) > 0
-    assert stem_volume_formula_65(0.5, 1.04) < 5
-
-
-def test_stem_volume_formula_66():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_67():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_68():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_69():
-    assert stem_volume_formula_69(5, 5) > 1
-    assert stem_volume_formula_69(30, 10) < 1000
-
-
-def test_stem_volume_formula_70():
-    assert stem_volume_formula_70(50, 35) > 0
-    assert stem_volume_formula_70(50, 35) < 10000  # dm³
-
-
-def test_stem_volume_formula_71():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_72():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_73():
-    assert stem_volume_formula_73(1, 1) > 0
-    assert stem_volume_formula_73(1, 1) < 1000000
-
-
-def test_stem_volume_formula_74():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_75():
-    assert stem_volume_formula_75(1, 2) > 0
-    assert stem_volume_formula_75(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_76():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_77():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_78():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_79():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_80():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_81():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_82():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_83():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_84():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_85():
-    assert stem_volume_formula_85(1) > 0
-    assert stem_volume_formula_85(30) < 1
-
-
-def test_stem_volume_formula_86():
-    assert stem_volume_formula_86(50, 35) > 0
-    assert stem_volume_formula_86(50, 35) < 10  # m³
-
-
-def test_stem_volume_formula_87():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_88():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_89():
-    assert stem_volume_formula_89(1.5, 1.8) > 0
-    assert stem_volume_formula_89(1.5, 1.8) < 1000000
-
-
-def test_stem_volume_formula_90():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_91():
-    assert stem_volume_formula_91(1, 2) > 0
-    assert stem_volume_formula_91(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_92():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_93():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_94():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_95():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_96():
-    assert stem_volume_formula_96(18, 10) > 0
-    assert stem_volume_formula_96(18, 10) < 200
-
-
-def test_stem_volume_formula_97():
-    assert stem_volume_formula_97(50, 35) > 0
-    assert stem_volume_formula_97(50, 35) < 100
-
-
-def test_stem_volume_formula_98():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_99():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_100():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_101():
-    assert stem_volume_formula_101(1, 1) > 0
-    assert stem_volume_formula_101(30, 10) < 1000
-
-
-def test_stem_volume_formula_102():
-    assert stem_volume_formula_102(50, 35) > 0
-    assert stem_volume_formula_102(50, 35) < 10000  # dm³
-
-
-def test_stem_volume_formula_103():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_104():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_105():
-    assert stem_volume_formula_105(1, 1) > 0
-    assert stem_volume_formula_105(1, 1) < 1000000
-
-
-def test_stem_volume_formula_106():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_107():
-    assert stem_volume_formula_107(1, 2) > 0
-    assert stem_volume_formula_107(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_108():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_109():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_110():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_111():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_112():
-    assert stem_volume_formula_112(10, 10) > 0
-    assert stem_volume_formula_112(10, 10) < 100
-
-
-def test_stem_volume_formula_113():
-    assert stem_volume_formula_113(10, 7) > 0
-    assert stem_volume_formula_113(10, 7) < 10000
-
-
-def test_stem_volume_formula_114():
-    assert 1 == 1
-
+    plausible = (0 < volumes) & (volumes < volume_cylinder * 1.5)
+    assert plausible.all(), (np.flatnonzero(~plausible) + 1).tolist()
 
-def test_stem_volume_formula_115():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_116():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_117():
-    assert stem_volume_formula_117(2, 2) > 0
-    assert stem_volume_formula_117(30, 10) < 1000
-
-
-def test_stem_volume_formula_118():
-    assert stem_volume_formula_118(50, 35) > 0
-    assert stem_volume_formula_118(50, 35) < 10000  # dm³
-
-
-def test_stem_volume_formula_119():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_120():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_121():
-    assert stem_volume_formula_121(4.5, 4) > 0
-    assert stem_volume_formula_121(4.5, 4) < 1000000
-
-
-def test_stem_volume_formula_122():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_123():
-    assert stem_volume_formula_123(1, 2) > 0
-    assert stem_volume_formula_123(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_124():
-    assert stem_volume_formula_96(10, 10) > 0
-    assert stem_volume_formula_96(10, 10) < 200
-
-
-def test_stem_volume_formula_125():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_126():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_127():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_128():
-    assert stem_volume_formula_128(30, 10) > 0
-    assert stem_volume_formula_128(30, 10) < 300
-
-
-def test_stem_volume_formula_129():
-    assert stem_volume_formula_129(32, 26) > 0
-    assert stem_volume_formula_129(32, 26) < 2000
-
-
-def test_stem_volume_formula_130():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_131():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_132():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_133():
-    assert stem_volume_formula_133(1, 1) > 0
-    assert stem_volume_formula_133(30, 10) < 1000
-
-
-def test_stem_volume_formula_134():
-    assert stem_volume_formula_134(50, 35) > 0
-    assert stem_volume_formula_134(50, 35) < 10000  # dm³
-
-
-def test_stem_volume_formula_135():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_136():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_137():
-    assert stem_volume_formula_137(1, 1) > 0
-    assert stem_volume_formula_137(1, 1) < 1000000
 
+@pytest.mark.parametrize('formula_no', range(1, NUM_FORMULAS + 1))
+def test_formula_accepts_arrays(
+    formula_no, formula_funcs, formula_params, formula_units
+):
+    """Tests that calling a formula with arrays gives the same volumes as
+    calling it once per tree
+    """
 
-def test_stem_volume_formula_138():
-    assert 1 == 1
+    f = formula_funcs[formula_no]
+    params = formula_params[formula_no]
+    parameter_units, _ = formula_units[formula_no]
 
+    args = {
+        'D': np.array([80.0, 200.0, 452.0]),  # diameters in mm
+        'H': np.array([65.0, 200.0, 290.0]),  # heights in dm
+    }
+    converted_args = [
+        args[par_name] / UNIT_DIVISORS[par_name][parameter_units[i]]
+        for i, par_name in enumerate(params)
+    ]
 
-def test_stem_volume_formula_139():
-    assert stem_volume_formula_139(1) > 0
-    assert stem_volume_formula_139(1) < 80, (
+    volumes = f(*converted_args)
+    assert volumes.shape == (3,)
+    for i in range(3):
+        volume = f(*[arg[i] for arg in converted_args])
+        assert volumes[i] == pytest.approx(volume, rel=1e-12, nan_ok=True)
+
+
+# Plausibility checks of single formulas: (formula number, arguments, lower
+# bound of the volume, arguments, upper bound of the volume)
+FORMULA_BOUNDS = [
+    (1, (20, 10), 0, (20, 10), 1000000),
+    (5, (1, 1), 0, (3, 100), 1000),
+    (6, (1, 25), 0, (1, 25), 10000),
+    (9, (20, 10), 0, (20, 10), 1000000),
+    (11, (1, 2), 0, (1, 2), 80),
+    (16, (1, 1), 0, (1, 1), 10),
+    (17, (10, 5), 0, (10, 5), 100000),
+    (21, (1, 1), 0, (30, 10), 1),
+    (22, (1, 25), 0, (1, 25), 10000),
+    (25, (44, 28), 0, (44, 28), 1000000),
+    (27, (2.13,), 0, (2.13,), 80000),
+    (31, (20, 10), 0, (20, 10), 1000),
+    (32, (1, 1), 0, (1, 1), 10),
+    (33, (5, 5), 0, (5, 5), 10000),
+    (37, (4.5, 6), 1, (30, 10), 1000),
+    (54, (10, 5), 0, (10, 5), 10000),
+    (41, (1, 1), 0, (1, 1), 1000000),
+    (43, (1, 2), 0, (1, 2), 80000),
+    (48, (30, 15), 0, (30, 15), 10),
+    (49, (20, 10), 0, (20, 10), 10),
+    (53, (1, 1), 0, (30, 10), 1000),
+    (54, (10, 2.5), 0, (10, 2.5), 10),
+    (57, (1, 1), 0, (1, 1), 1000000),
+    (59, (1, 2), 0, (1, 2), 80000),
+    (64, (2.5, 25), 25, (2.5, 25), 35),
+    (65, (0.5, 1.04), 0, (0.5, 1.04), 5),
+    (69, (5, 5), 1, (30, 10), 1000),
+    (70, (50, 35), 0, (50, 35), 10000),
+    (73, (1, 1), 0, (1, 1), 1000000),
+    (75, (1, 2), 0, (1, 2), 80000),
+    (85, (1,), 0, (30,), 1),
+    (86, (50, 35), 0, (50, 35), 10),
+    (89, (1.5, 1.8), 0, (1.5, 1.8), 1000000),
+    (91, (1, 2), 0, (1, 2), 80000),
+    (96, (18, 10), 0, (18, 10), 200),
+    (97, (50, 35), 0, (50, 35), 100),
+    (101, (1, 1), 0, (30, 10), 1000),
+    (102, (50, 35), 0, (50, 35), 10000),
+    (105, (1, 1), 0, (1, 1), 1000000),
+    (107, (1, 2), 0, (1, 2), 80000),
+    (112, (10, 10), 0, (10, 10), 100),
+    (113, (10, 7), 0, (10, 7), 10000),
+    (117, (2, 2), 0, (30, 10), 1000),
+    (118, (50, 35), 0, (50, 35), 10000),
+    (121, (4.5, 4), 0, (4.5, 4), 1000000),
+    (123, (1, 2), 0, (1, 2), 80000),
+    (96, (10, 10), 0, (10, 10), 200),
+    (128, (30, 10), 0, (30, 10), 300),
+    (129, (32, 26), 0, (32, 26), 2000),
+    (133, (1, 1), 0, (30, 10), 1000),
+    (134, (50, 35), 0, (50, 35), 10000),
+    (137, (1, 1), 0, (1, 1), 1000000),
+    (139, (1,), 0, (1,), 80),
+    (144, (5, 100), 0, (5, 100), 1000),
+    (145, (30,), 0, (30,), 100),
+    (149, (1, 1.5), 0, (30, 10), 1000),
+    (153, (1, 1), 0, (1, 1), 1000000),
+    (155, (1, 2), 0, (1, 2), 80),
+    (160, (30, 15), 0, (30, 15), 1000),
+    (161, (50, 25), 0, (50, 25), 10000),
+    (165, (1, 1), 0, (30, 10), 1000),
+    (166, (10, 5), 0, (10, 5), 10000),
+    (169, (1, 1), 0, (1, 1), 1000000),
+    (171, (1, 2), 0, (1, 2), 80000),
+    (176, (25, 15), 0, (25, 15), 1000),
+    (177, (30, 35), 0, (30, 35), 10000),
+    (179, (1, 1), 0, (300, 10), 1000),
+    (181, (1, 1), 0, (300, 10), 1000),
+    (182, (50, 35), 0, (50, 35), 10),
+    (185, (1, 1), 0, (1, 1), 1000000),
+    (187, (1, 2), 0, (1, 2), 80),
+    (192, (30, 12), 0, (30, 12), 1),
+    (193, (48, 35), 0, (48, 32), 10),
+    (197, (1, 1), 0, (300, 10), 1000),
+    (198, (500, 35), 0, (500, 35), 10000),
+    (201, (1, 1), 0, (1, 1), 1000000),
+    (203, (1, 2), 0, (1, 2), 80),
+    (208, (40, 15), 0, (40, 15), 1),
+    (209, (40, 25), 0, (40, 25), 1000000),
+    (213, (1, 1), 0, (300, 10), 1000),
+    (214, (500, 35), 0, (500, 35), 10000),
+    (217, (10, 3), 0, (10, 3), 1000000),
+    (219, (1, 2), 0, (1, 2), 80),
+    (224, (30, 12), 0, (30, 12), 1000),
+    (225, (70, 55), 0, (70, 55), 1),
+    (229, (1, 1), 0, (30, 10), 1000),
+    (230, (50, 35), 0, (50, 35), 10),
+]
+
+
+@pytest.mark.parametrize('formula_no, lo_args, lo, hi_args, hi', FORMULA_BOUNDS)
+def test_stem_volume_formula(
+    formula_no, lo_args, lo, hi_args, hi, formula_funcs
+):
+    f = formula_funcs[formula_no]
+    assert f(*lo_args) > lo
+    assert f(*hi_args) < hi, (
         'Check your input values, the resulting volume seems unrealistic'
     )
 
 
-def test_stem_volume_formula_141():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_142():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_143():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_144():
-    assert stem_volume_formula_144(5, 100) > 0
-    assert stem_volume_formula_144(5, 100) < 1000
-
-
-def test_stem_volume_formula_145():
-    assert stem_volume_formula_145(30) > 0
-    assert stem_volume_formula_145(30) < 100
-
-
-def test_stem_volume_formula_146():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_147():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_148():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_149():
-    assert stem_volume_formula_149(1, 1.5) > 0
-    assert stem_volume_formula_149(30, 10) < 1000
-
-
 def test_stem_volume_formula_150():
-    assert exp(stem_volume_formula_150(50, 35)) > 0
-    assert exp(stem_volume_formula_150(50, 35)) < 10000  # ln(dm³)
-
-
-def test_stem_volume_formula_151():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_152():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_153():
-    assert stem_volume_formula_153(1, 1) > 0
-    assert stem_volume_formula_153(1, 1) < 1000000
-
-
-def test_stem_volume_formula_154():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_155():
-    assert stem_volume_formula_155(1, 2) > 0
-    assert stem_volume_formula_155(1, 2) < 80, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_156():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_157():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_158():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_159():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_160():
-    assert stem_volume_formula_160(30, 15) > 0
-    assert stem_volume_formula_160(30, 15) < 1000
-
-
-def test_stem_volume_formula_161():
-    assert stem_volume_formula_161(50, 25) > 0
-    assert stem_volume_formula_161(50, 25) < 10000
-
-
-def test_stem_volume_formula_162():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_163():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_164():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_165():
-    assert stem_volume_formula_165(1, 1) > 0
-    assert stem_volume_formula_165(30, 10) < 1000
-
-
-def test_stem_volume_formula_166():
-    assert stem_volume_formula_166(10, 5) > 0
-    assert stem_volume_formula_166(10, 5) < 10000  # dm³
-
-
-def test_stem_volume_formula_167():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_168():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_169():
-    assert stem_volume_formula_169(1, 1) > 0
-    assert stem_volume_formula_169(1, 1) < 1000000
-
-
-def test_stem_volume_formula_170():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_171():
-    assert stem_volume_formula_171(1, 2) > 0
-    assert stem_volume_formula_171(1, 2) < 80000, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_172():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_173():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_174():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_175():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_176():
-    assert stem_volume_formula_176(25, 15) > 0
-    assert stem_volume_formula_176(25, 15) < 1000
-
-
-def test_stem_volume_formula_177():
-    assert stem_volume_formula_177(30, 35) > 0
-    assert stem_volume_formula_177(30, 35) < 10000
-
-
-def test_stem_volume_formula_178():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_179():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_180():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_181():
-    assert stem_volume_formula_181(1, 1) > 0
-    assert stem_volume_formula_181(300, 10) < 1000
-
-
-def test_stem_volume_formula_182():
-    assert stem_volume_formula_182(50, 35) > 0
-    assert stem_volume_formula_182(50, 35) < 10  # m³
-
-
-def test_stem_volume_formula_183():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_184():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_185():
-    assert stem_volume_formula_185(1, 1) > 0
-    assert stem_volume_formula_185(1, 1) < 1000000
-
-
-def test_stem_volume_formula_186():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_187():
-    assert stem_volume_formula_187(1, 2) > 0
-    assert stem_volume_formula_187(1, 2) < 80, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_188():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_189():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_190():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_191():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_192():
-    assert stem_volume_formula_192(30, 12) > 0
-    assert stem_volume_formula_192(30, 12) < 1
-
-
-def test_stem_volume_formula_193():
-    assert stem_volume_formula_193(48, 35) > 0
-    assert stem_volume_formula_193(48, 32) < 10
-
-
-def test_stem_volume_formula_194():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_195():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_196():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_197():
-    assert stem_volume_formula_197(1, 1) > 0
-    assert stem_volume_formula_197(300, 10) < 1000
-
-
-def test_stem_volume_formula_198():
-    assert stem_volume_formula_198(500, 35) > 0
-    assert stem_volume_formula_198(500, 35) < 10000  # dm³
-
-
-def test_stem_volume_formula_199():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_200():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_201():
-    assert stem_volume_formula_201(1, 1) > 0
-    assert stem_volume_formula_201(1, 1) < 1000000
-
-
-def test_stem_volume_formula_202():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_203():
-    assert stem_volume_formula_203(1, 2) > 0
-    assert stem_volume_formula_203(1, 2) < 80, (
-        'Check your input values, the resulting volume seems unrealistic'
-    )
-
-
-def test_stem_volume_formula_204():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_205():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_206():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_207():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_208():
-    assert stem_volume_formula_208(40, 15) > 0
-    assert stem_volume_formula_208(40, 15) < 1
-
-
-def test_stem_volume_formula_209():
-    assert stem_volume_formula_209(40, 25) > 0
-    assert stem_volume_formula_209(40, 25) < 1000000
-
-
-def test_stem_volume_formula_210():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_211():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_212():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_213():
-    assert stem_volume_formula_213(1, 1) > 0
-    assert stem_volume_formula_213(300, 10) < 1000
-
-
-def test_stem_volume_formula_214():
-    assert stem_volume_formula_214(500, 35) > 0
-    assert stem_volume_formula_214(500, 35) < 10000  # dm³
+    assert exp(formulas.stem_volume_formula_150(50, 35)) > 0
+    assert exp(formulas.stem_volume_formula_150(50, 35)) < 10000  # ln(dm³)
 
 
 def test_stem_volume_formula_215():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_216():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_217():
-    assert stem_volume_formula_217(10, 3) > 0
-    assert stem_volume_formula_217(10, 3) < 1000000
-
-
-def test_stem_volume_formula_218():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_219():
-    assert stem_volume_formula_219(1, 2) > 0
-    assert stem_volume_formula_219(1, 2) < 80, (
-        'Check your input values, the resulting volume seems unrealistic'
+    # D is raised to b + c, as in formulas 213 and 214
+    a, b, c, d = 0.00095853, 2.040672356, -0.04354461, 0.56366437
+    assert formulas.stem_volume_formula_215(300, 30) == pytest.approx(
+        a * 300 ** (b + c) * 30**d
     )
 
 
-def test_stem_volume_formula_220():
-    assert 1 == 1
-
-
 def test_stem_volume_formula_221():
-    assert 1 == 1
+    # 10 is raised to the log polynomial, as in the other Giurgiu formulas
+    a, b, c, d, e = 7.325e-05, 1.5598, 0.0302, 0.8572, 0.1791
+    log_d, log_h = np.log10(30), np.log10(25)
+    assert formulas.stem_volume_formula_221(30, 25) == pytest.approx(
+        a * 10 ** (b * log_d + c * log_d**2 + d * log_h + e * log_h**2)
+    )
 
 
 def test_stem_volume_formula_222():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_223():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_224():
-    assert stem_volume_formula_224(30, 12) > 0
-    assert stem_volume_formula_224(30, 12) < 1000
-
-
-def test_stem_volume_formula_225():
-    assert stem_volume_formula_225(70, 55) > 0
-    assert stem_volume_formula_225(70, 55) < 1
-
-
-def test_stem_volume_formula_226():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_227():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_228():
-    assert 1 == 1
-
-
-def test_stem_volume_formula_229():
-    assert stem_volume_formula_229(1, 1) > 0
-    assert stem_volume_formula_229(30, 10) < 1000
-
-
-def test_stem_volume_formula_230():
-    assert stem_volume_formula_230(50, 35) > 0
-    assert stem_volume_formula_230(50, 35) < 10  # m³
+    # formula 222 has the same form and coefficients as formula 218
+    assert formulas.stem_volume_formula_222(3, 2.5) == pytest.approx(
+        formulas.stem_volume_formula_218(3, 2.5)
+    )
@@ -1,68 +1,132 @@
 from inspect import signature
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from stem_volumes.__init__ import ALL_FORMULAS, calculate_stem_volumes
+from stem_volumes import formulas as formula_mod
+from stem_volumes.__init__ import (
+    ALL_FORMULAS,
+    _calculate_stem_volumes_rowwise,
+    _calculate_stem_volumes_vectorized,
+    calculate_stem_volumes,
+    get_formula_metadata,
+)
 from stem_volumes.species_to_formula_map import species_to_formulas
 
 
-def test_all_applicable_formulas_applied():
-    # Build a DataFrame with one row for each species in the mapping
-    data = []
+@pytest.fixture(scope='module')
+def applied_df():
+    # Resolve the parameters of each mapped formula once, not once per species
+    params_by_name = {}
+    for func_name in {fn for fns in species_to_formulas.values() for fn in fns}:
+        if func_name in ALL_FORMULAS:
+            params_by_name[func_name] = ALL_FORMULAS[func_name][0]
+        elif hasattr(formula_mod, func_name):
+            func = getattr(formula_mod, func_name)
+            params_by_name[func_name] = tuple(signature(func).parameters)
+
+    # Build a DataFrame with one row for each species in the mapping, with
+    # NaN where the formula does not take the diameter or height
+    species_col, d_col, h_col = [], [], []
     for species, formulas in species_to_formulas.items():
         for func_name in formulas:
-            row = {
-                'species': species,
-                'diameter at breast height [mm]': 300,
-                'height [dm]': 100,
-            }
-            params = None
-            if func_name in ALL_FORMULAS:
-                params = ALL_FORMULAS[func_name][0]
-            else:
-                try:
-                    from stem_volumes import formulas as formula_mod
-
-                    func = getattr(formula_mod, func_name)
-                    params = tuple(signature(func).parameters)
-                except Exception:
-                    pass
+            d, h = 300.0, 100.0
+            params = params_by_name.get(func_name)
             if params:
                 if 'D' not in params:
-                    row.pop('diameter at breast height [mm]')
+                    d = np.nan
                 if 'H' not in params:
-                    row.pop('height [dm]')
-            data.append(row)
-    df = pd.DataFrame(data)
+                    h = np.nan
+            species_col.append(species)
+            d_col.append(d)
+            h_col.append(h)
+    df = pd.DataFrame(
+        {
+            'species': species_col,
+            'diameter at breast height [mm]': d_col,
+            'height [dm]': h_col,
+        }
+    )
+
+    # Calculate volumes once for all tests of the module
+    return calculate_stem_volumes(df)
+
+
+def test_all_applicable_formulas_applied(applied_df):
+    result_df = applied_df
 
-    # Calculate volumes
-    result_df = calculate_stem_volumes(df)
+    # Flag once per normalized species and volume column whether any value is
+    # present, instead of reducing each column of each species separately
+    norm_species_col = result_df['species'].str.strip().str.lower()
+    volume_columns = [c for c in result_df.columns if c.endswith(' [m3]')]
+    presence = (
+        result_df[volume_columns]
+        .notna()
+        .groupby(norm_species_col, sort=False)
+        .any()
+    )
 
     # Check for each species that all mapped formulas have a corresponding column
     for species, formulas in species_to_formulas.items():
         norm_species = species.strip().lower()
-        rows = result_df[
-            result_df['species'].str.strip().str.lower() == norm_species
-        ]
-        assert not rows.empty, f"No rows found for species '{species}'"
+        assert norm_species in presence.index, (
+            f"No rows found for species '{species}'"
+        )
         for func_name in formulas:
             colname = f'{func_name} [m3]'
             assert colname in result_df.columns, (
                 f"Missing column {colname} for species '{species}'"
             )
-            # Try vectorized check first, fallback to row-wise if needed
-            try:
-                # Vectorized: at least one value is not NA
-                assert rows[colname].notna().any(), (
-                    f"All values NA for {colname} in species '{species}'"
-                )
-            except Exception:
-                # Row-wise fallback: check each row individually
-                found = False
-                for _, row in rows.iterrows():
-                    if pd.notna(row[colname]):
-                        found = True
-                        break
-                assert found, (
-                    f"All values NA for {colname} in species '{species}' (row-wise checked)"
-                )
+            assert presence.at[norm_species, colname], (
+                f"All values NA for {colname} in species '{species}'"
+            )
+
+
+def test_applied_volumes_are_float(applied_df):
+    volume_columns = [c for c in applied_df.columns if c.endswith(' [m3]')]
+    assert (applied_df[volume_columns].dtypes == 'float64').all()
+
+
+def test_volume_columns_are_float():
+    df = pd.DataFrame(
+        {
+            'species': ['Beech', 'unknown species', None],
+            'diameter at breast height [mm]': [300.0, 300.0, 300.0],
+            'height [dm]': [100.0, 100.0, 100.0],
+        }
+    )
+    for calculate in (
+        _calculate_stem_volumes_rowwise,
+        _calculate_stem_volumes_vectorized,
+    ):
+        result_df = calculate(df)
+        volume_columns = [c for c in result_df.columns if c.endswith('[m3]')]
+        assert volume_columns
+        assert (result_df[volume_columns].dtypes == 'float64').all()
+        assert result_df.loc[1:, volume_columns].isna().all().all()
+
+
+def test_get_formula_metadata():
+    assert get_formula_metadata(1)[0] == 'stem_volume_formula_1'
+    assert get_formula_metadata(230)[0] == 'stem_volume_formula_230'
+    for formula_no in (0, -1, 231):
+        with pytest.raises(ValueError):
+            get_formula_metadata(formula_no)
+
+
+def test_species_without_strings():
+    df = pd.DataFrame(
+        {
+            'species': [np.nan, np.nan],
+            'diameter at breast height [mm]': [300.0, 200.0],
+            'height [dm]': [100.0, 90.0],
+        }
+    )
+    for calculate in (
+        _calculate_stem_volumes_rowwise,
+        _calculate_stem_volumes_vectorized,
+    ):
+        result_df = calculate(df)
+        volume_columns = [c for c in result_df.columns if c.endswith('[m3]')]
+        assert result_df[volume_columns].isna().all().all()
@@ -1,20 +1,19 @@
+from stem_volumes.batch import NUM_FORMULAS
+
+# All expected formulas
+EXPECTED_FORMULA_NAMES = frozenset(
+    f'stem_volume_formula_{i}' for i in range(1, NUM_FORMULAS + 1)
+)
+
+
 def test_all_formulas_in_genus_map():
     from stem_volumes.genus_formula_map import genus_to_formulas
 
     # Collect all formulas from the mapping
-    mapped_formulas = set()
-    for formulas in genus_to_formulas.values():
-        mapped_formulas.update(formulas)
-
-    # All expected formulas
-    expected_formulas = {f'stem_volume_formula_{i}' for i in range(1, 231)}
-
-    missing = expected_formulas - mapped_formulas
-    extra = mapped_formulas - expected_formulas
+    mapped_formulas = frozenset().union(*genus_to_formulas.values())
 
-    assert not missing, (
-        f'Missing formulas in genus_to_formulas: {sorted(missing)}'
-    )
-    assert not extra, (
-        f'Unexpected formulas in genus_to_formulas: {sorted(extra)}'
-    )
+    # The differences are only computed when the sets do not match
+    assert mapped_formulas == EXPECTED_FORMULA_NAMES, {
+        'missing': sorted(EXPECTED_FORMULA_NAMES - mapped_formulas),
+        'unexpected': sorted(mapped_formulas - EXPECTED_FORMULA_NAMES),
+    }
@@ -1,44 +1,65 @@
 from math import exp
 from math import log as ln
 
+import numpy as np
+import pandas as pd
+import pytest
 from pytest import approx
 
+from stem_volumes.formulas import stem_volume_formula_1
+from stem_volumes.genus_dict import genus_species_common_dict
 from stem_volumes.utils import (
+    clean_data,
     convert_volume_to_m3,
+    extract_parameter_units,
+    extract_species_from_docstring,
+    extract_volume_unit,
+    get_genus_row_map,
+    match_species_names,
 )
 
 
-def test_convert_volume_to_m3():
-    assert convert_volume_to_m3(0.1, 'm3') == 0.1
-    assert convert_volume_to_m3(1, 'm3') == 1
-    assert convert_volume_to_m3(1000, 'm3') == 1000
-
-    assert convert_volume_to_m3(0.1, 'dm3') == 0.1 / 1000
-    assert convert_volume_to_m3(1, 'dm3') == 1 / 1000
-    assert convert_volume_to_m3(1000, 'dm3') == 1000 / 1000
-
-    assert convert_volume_to_m3(0.1, 'ln(m3)') == exp(0.1)
-    assert convert_volume_to_m3(1, 'ln(m3)') == exp(1)
-    assert convert_volume_to_m3(10, 'ln(m3)') == exp(10)
-
-    assert convert_volume_to_m3(ln(0.1), 'ln(m3)') == approx(0.1)
-    assert convert_volume_to_m3(ln(1), 'ln(m3)') == 1
-    assert convert_volume_to_m3(ln(1000), 'ln(m3)') == approx(1000)
+@pytest.mark.parametrize(
+    'value, unit, expected',
+    [
+        (0.1, 'm3', 0.1),
+        (1, 'm3', 1),
+        (1000, 'm3', 1000),
+        (0.1, 'dm3', 0.1 / 1000),
+        (1, 'dm3', 1 / 1000),
+        (1000, 'dm3', 1000 / 1000),
+        (0.1, 'ln(m3)', exp(0.1)),
+        (1, 'ln(m3)', exp(1)),
+        (10, 'ln(m3)', exp(10)),
+        (ln(0.1), 'ln(m3)', approx(0.1)),
+        (ln(1), 'ln(m3)', 1),
+        (ln(1000), 'ln(m3)', approx(1000)),
+        (0.1, 'ln(dm3)', exp(0.1) / 1000),
+        (1, 'ln(dm3)', exp(1) / 1000),
+        (10, 'ln(dm3)', exp(10) / 1000),
+        (ln(0.1), 'ln(dm3)', approx(0.0001)),
+        (ln(1), 'ln(dm3)', 0.001),
+        (ln(1000), 'ln(dm3)', approx(1)),
+    ],
+)
+def test_convert_volume_to_m3(value, unit, expected):
+    assert convert_volume_to_m3(value, unit) == expected
 
-    assert convert_volume_to_m3(0.1, 'ln(dm3)') == exp(0.1) / 1000
-    assert convert_volume_to_m3(1, 'ln(dm3)') == exp(1) / 1000
-    assert convert_volume_to_m3(10, 'ln(dm3)') == exp(10) / 1000
 
-    assert convert_volume_to_m3(ln(0.1), 'ln(dm3)') == approx(0.0001)
-    assert convert_volume_to_m3(ln(1), 'ln(dm3)') == 0.001
-    assert convert_volume_to_m3(ln(1000), 'ln(dm3)') == approx(1)
+@pytest.mark.parametrize('unit', ['m3', 'dm3', 'ln(m3)', 'ln(dm3)'])
+def test_convert_volume_to_m3_array(unit):
+    values = np.array([0.1, 1, 10])
+    volumes = convert_volume_to_m3(values, unit)
+    np.testing.assert_allclose(
+        volumes, [convert_volume_to_m3(value, unit) for value in values]
+    )
+    # The input array is left unchanged
+    np.testing.assert_array_equal(values, [0.1, 1, 10])
 
 
-def extract_species_from_docstring(docstring):
-    for line in docstring.splitlines():
-        if line.strip().startswith('Species'):
-            return line.split(':', 1)[1].strip()
-    return ''
+def test_convert_volume_to_m3_unknown_unit():
+    with pytest.raises(KeyError):
+        convert_volume_to_m3(1, 'l')
 
 
 def test_extract_species_from_docstring():
@@ -69,3 +90,74 @@ def test_extract_species_from_docstring():
     )
     assert extract_species_from_docstring(docstring2) == 'Abies alba'
     assert extract_species_from_docstring(docstring3) == ''
+    assert extract_species_from_docstring(
+        docstring1
+    ) is extract_species_from_docstring(docstring1)
+
+
+def test_extract_units_are_cached():
+    f = stem_volume_formula_1
+    assert extract_parameter_units(f) == ('cm', 'm')
+    assert extract_parameter_units(f) is extract_parameter_units(f)
+    assert extract_volume_unit(f) == 'dm3'
+    assert extract_volume_unit.cache_info().hits > 0
+
+
+def test_match_species_names():
+    df = pd.DataFrame(
+        {
+            'species': [
+                'Silver fir',
+                'grand fir',
+                'unknown',
+                'Other coniferous trees',
+            ]
+        }
+    )
+    assert match_species_names(df) == [
+        ('Abies', 'Silver fir'),
+        ('Abies', 'grand fir'),
+        (None, None),
+        (_first_genus('other coniferous trees'), 'Other coniferous trees'),
+    ]
+
+
+def _first_genus(name):
+    return next(
+        genus
+        for genus, data in genus_species_common_dict.items()
+        if name in (s.lower() for s in data['species'])
+    )
+
+
+def test_get_genus_row_map():
+    genus_series = pd.Series(
+        ['Picea', None, 'Abies', 'Picea', float('nan'), 'Abies', 'Fagus'],
+        index=range(10, 17),
+    )
+    genus_row_map = get_genus_row_map(genus_series)
+    assert genus_row_map == {
+        'Picea': [10, 13],
+        'Abies': [12, 15],
+        'Fagus': [16],
+    }
+    assert list(genus_row_map) == ['Picea', 'Abies', 'Fagus']
+    assert get_genus_row_map(pd.Series([None, None])) == {}
+
+
+def test_clean_data_drops_duplicates_differing_in_case():
+    df = pd.DataFrame(
+        {
+            'species': ['picea abies', 'Picea abies', 'PICEA ABIES', 'fagus'],
+            'diameter at breast height [mm]': [200.0, 200.0, 300.0, 200.0],
+            'height [dm]': [150.0, 150.0, 150.0, 150.0],
+        }
+    )
+    df_cleaned = clean_data(df)
+    assert list(df_cleaned.index) == [0, 2, 3]
+    assert list(df_cleaned['species']) == [
+        'Picea abies',
+        'Picea abies',
+        'Fagus',
+    ]
+    assert list(df['species'])[0] == 'picea abies'